@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Annotated, Any, Sequence
 
 from dotenv import load_dotenv
@@ -382,8 +383,30 @@ ETL 검증 쿼리 생성, 데이터 품질 규칙 제안 등의 작업을 수행
 """
 
 
+@lru_cache(maxsize=8)
+def _system_prompt(db_type: str) -> str:
+    """고정 System Prompt + DB 정보 — 달라지는 부분은 db_type뿐이므로 값별로 한 번만 생성"""
+    return (
+        _SYSTEM_PROMPT
+        + f"\n\n## 현재 연결 DB 정보\n"
+        f"- 현재 연결된 DB: **{db_type.upper()}**\n"
+        f"- 모든 Tool 호출 시 반드시 `db_type='{db_type}'`을 전달하세요.\n"
+        f"- generate_validation_queries_tool, suggest_rules_tool 호출 시 db_type 인자를 절대 생략하지 마세요.\n"
+    )
+
+
+# get_llm()의 선택 결과를 좌우하는 환경변수 — 값이 바뀌면 캐시 키도 바뀌어 재생성
+_LLM_ENV_KEYS = ("LLM_PROVIDER", "GOOGLE_API_KEY", "ANTHROPIC_API_KEY", "OPENAI_API_KEY")
+
+
 def _get_llm_with_tools():
     """Tool binding된 LLM 반환 (LLM_PROVIDER 환경변수로 프로바이더 선택 가능)"""
+    return _llm_with_tools_cached(tuple(os.getenv(k, "") for k in _LLM_ENV_KEYS))
+
+
+@lru_cache(maxsize=4)
+def _llm_with_tools_cached(_env: tuple[str, ...]):
+    # agent 노드는 tool 호출마다 다시 실행되므로 클라이언트 생성 + bind_tools를 hop마다 반복하지 않음
     from aetl_llm import get_llm
     return get_llm(with_tools=_TOOLS)
 
@@ -399,14 +422,7 @@ def agent_node(state: AETLState) -> dict:
     messages = list(state["messages"])
 
     # ── db_type을 System Prompt에 동적 주입 ──
-    db_type = state.get("db_type", "oracle")
-    dynamic_prompt = (
-        _SYSTEM_PROMPT
-        + f"\n\n## 현재 연결 DB 정보\n"
-        f"- 현재 연결된 DB: **{db_type.upper()}**\n"
-        f"- 모든 Tool 호출 시 반드시 `db_type='{db_type}'`을 전달하세요.\n"
-        f"- generate_validation_queries_tool, suggest_rules_tool 호출 시 db_type 인자를 절대 생략하지 마세요.\n"
-    )
+    dynamic_prompt = _system_prompt(state.get("db_type", "oracle"))
 
     # System prompt 삽입 또는 교체
     if not messages or not isinstance(messages[0], SystemMessage):
@@ -420,10 +436,10 @@ def agent_node(state: AETLState) -> dict:
 
 def tool_node(state: AETLState) -> dict:
     """Tool 실행 노드 — LLM이 요청한 도구를 실행"""
-    last_message = state["messages"][-1]
+    tool_calls = state["messages"][-1].tool_calls
     tool_messages = []
 
-    for tool_call in last_message.tool_calls:
+    for tool_call in tool_calls:
         tool_name = tool_call["name"]
         tool_args  = tool_call["args"]
         tool_id    = tool_call["id"]
@@ -466,6 +482,12 @@ def build_graph() -> Any:
     return graph.compile()
 
 
+@lru_cache(maxsize=1)
+def _compiled_graph() -> Any:
+    # 그래프 구조는 고정이므로 프로세스당 한 번만 compile (노드 상태는 invoke마다 새로 생성됨)
+    return build_graph()
+
+
 # ─────────────────────────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────────────────────────
@@ -488,7 +510,7 @@ def run_agent(
     Returns:
         (final_answer: str, updated_history: list[dict])
     """
-    graph = build_graph()
+    graph = _compiled_graph()
 
     # 이전 이력 → BaseMessage 변환
     messages: list[BaseMessage] = []
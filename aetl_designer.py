@@ -26,6 +26,9 @@ from dotenv import load_dotenv
 
 load_dotenv(override=True)
 
+# LLM 응답에서 JSON 블록(첫 '{' ~ 마지막 '}') 추출
+_JSON_BLOCK_RE = re.compile(r"\{[\s\S]+\}")
+
 
 # ─────────────────────────────────────────────────────────────
 # 0. Star Schema 설계 참고 가이드 로더
@@ -157,7 +160,7 @@ def parse_table_definition_text(text: str, max_chars: int = 12000) -> dict:
 }}
 """
     raw = _call_llm(prompt)
-    m = re.search(r"\{[\s\S]+\}", raw)
+    m = _JSON_BLOCK_RE.search(raw)
     if not m:
         return {"entities": [], "source": "text_ai",
                 "warning": "⚠ AI가 구조를 추출하지 못했습니다. 직접 입력하세요."}
@@ -219,7 +222,7 @@ def parse_pdf_document(pdf_bytes: bytes) -> dict:
 }}
 """
     raw = call_llm_with_pdf(prompt, pdf_bytes)
-    m = re.search(r"\{[\s\S]+\}", raw)
+    m = _JSON_BLOCK_RE.search(raw)
     if not m:
         return {"entities": [], "source": "pdf_ai",
                 "warning": "⚠ AI가 PDF에서 구조를 추출하지 못했습니다. 텍스트 추출을 시도하세요."}
@@ -334,7 +337,7 @@ def design_star_schema(entities: list[dict], context: str = "") -> dict:
     if '"error"' in raw and "LLM 호출 실패" in raw:
         raise RuntimeError(f"LLM 호출 실패: {raw}")
 
-    m = re.search(r"\{[\s\S]+\}", raw)
+    m = _JSON_BLOCK_RE.search(raw)
     if not m:
         raise RuntimeError(
             f"LLM 응답에서 JSON을 추출할 수 없습니다.\n"
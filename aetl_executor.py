@@ -12,12 +12,19 @@ AETL Execution Engine  —  v2.1
 from __future__ import annotations
 
 import json
+import re
 import time
+from functools import lru_cache
 from typing import Any
 
 import sqlglot
 from sqlglot import exp
 
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
+
 
 # ─────────────────────────────────────────────────────────────
 # SQL 분류기 (sqlglot 규칙 기반)
@@ -26,14 +33,28 @@ from sqlglot import exp
 _DIALECT_MAP = {"oracle": "oracle", "mariadb": "mysql", "postgresql": "postgres"}
 
 
+@lru_cache(maxsize=256)
+def _parse_sql(sql: str, dialect: str) -> exp.Expression:
+    """
+    sqlglot 파싱 결과를 (SQL, 방언) 기준으로 캐시합니다.
+    classify_sql → _has_dml_in_tree → execute_query 처럼 같은 SQL을 연달아 검사할 때
+    한 번만 파싱합니다. 반환된 AST는 공유되므로 읽기 전용으로만 사용합니다.
+    """
+    return sqlglot.parse_one(sql, dialect=dialect)
+
+
+@lru_cache(maxsize=256)
 def classify_sql(sql: str, db_type: str = "oracle") -> str:
     """
     SQL 구문을 분류합니다 (sqlglot AST 기반).
     Returns: "SELECT" | "DML" | "DDL" | "UNKNOWN"
+
+    Streamlit rerun마다 같은 SQL이 다시 분류되므로 (SQL, db_type) 기준으로 결과를 캐시합니다.
+    파싱 실패 → 키워드 fallback 결과도 캐시되어 재파싱하지 않습니다.
     """
     dialect = _DIALECT_MAP.get(db_type, "ansi")
     try:
-        parsed = sqlglot.parse_one(sql.strip(), dialect=dialect)
+        parsed = _parse_sql(sql.strip(), dialect)
         if isinstance(parsed, (exp.Select, exp.Union, exp.Intersect, exp.Except)):
             return "SELECT"
         elif isinstance(parsed, (exp.Insert, exp.Update, exp.Delete, exp.Merge)):
@@ -53,6 +74,7 @@ def classify_sql(sql: str, db_type: str = "oracle") -> str:
         return "UNKNOWN"
 
 
+@lru_cache(maxsize=256)
 def _has_dml_in_tree(sql: str, db_type: str) -> bool:
     """
     AST 트리 전체를 탐색하여 서브쿼리 내 DML/DDL 노드 존재 시 True 반환.
@@ -60,7 +82,7 @@ def _has_dml_in_tree(sql: str, db_type: str) -> bool:
     """
     dialect = _DIALECT_MAP.get(db_type, "ansi")
     try:
-        parsed = sqlglot.parse_one(sql.strip(), dialect=dialect)
+        parsed = _parse_sql(sql.strip(), dialect)
         for node in parsed.walk():
             if isinstance(node, (
                 exp.Insert, exp.Update, exp.Delete, exp.Merge,
@@ -316,6 +338,19 @@ def diagnose_failure(
     return _parse_diagnosis_response(raw_response, source_table, target_table, db_type)
 
 
+def _dumps_result(result: dict) -> str:
+    """
+    검증 결과를 프롬프트용 JSON 문자열로 직렬화합니다.
+    결과에 조회 행이 최대 수천 건 포함될 수 있어 orjson이 있으면 우선 사용합니다.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, default=str).decode("utf-8")
+        except TypeError:  # 64bit 초과 정수 등 orjson 미지원 값
+            pass
+    return json.dumps(result, ensure_ascii=False, default=str)
+
+
 def _build_diagnosis_prompt(
     validation_name: str, result: dict,
     source_table: str, target_table: str, db_type: str
@@ -328,7 +363,7 @@ def _build_diagnosis_prompt(
 - 소스 테이블: {source_table}
 - 타겟 테이블: {target_table}
 - DB 종류: {db_type}
-- 실행 결과: {json.dumps(result, ensure_ascii=False, default=str)[:500]}
+- 실행 결과: {_dumps_result(result)[:500]}
 
 ## 응답 형식 (JSON만 응답)
 {{
@@ -355,10 +390,12 @@ def _call_llm(prompt: str) -> str:
     return call_llm(prompt)
 
 
+_JSON_BLOCK_RE = re.compile(r"\{[\s\S]+\}")
+
+
 def _parse_diagnosis_response(raw: str, source_table: str, target_table: str, db_type: str) -> dict:
-    import re
     # JSON 블록 추출
-    m = re.search(r"\{[\s\S]+\}", raw)
+    m = _JSON_BLOCK_RE.search(raw)
     if not m:
         return {"diagnosis": raw, "probing_results": [], "fix_sqls": []}
     try:
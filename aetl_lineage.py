@@ -55,6 +55,10 @@ def parse_lineage(sql: str, db_type: str = "oracle") -> dict:
         result["error"] = f"파싱 실패: {e}"
         return result
 
+    # 리스트 멤버십(O(n)) 대신 집합으로 중복/CTE 여부 판정 — 결과 리스트 순서는 그대로
+    cte_names: set[str] = set()
+    seen_sources: set[str] = set()
+
     for stmt in statements:
         if stmt is None:
             continue
@@ -64,6 +68,7 @@ def parse_lineage(sql: str, db_type: str = "oracle") -> dict:
             alias = cte.alias
             if alias:
                 result["ctes"].append(alias)
+                cte_names.add(alias)
 
         # INSERT INTO target_table SELECT ...
         if isinstance(stmt, exp.Insert):
@@ -80,10 +85,11 @@ def parse_lineage(sql: str, db_type: str = "oracle") -> dict:
         # 소스 테이블 수집 (FROM / JOIN)
         for tbl in stmt.find_all(exp.Table):
             name = _table_name(tbl)
-            if name and name not in result["ctes"]:
-                if name != result["target_table"]:
-                    if name not in result["source_tables"]:
-                        result["source_tables"].append(name)
+            if (name and name not in cte_names
+                    and name != result["target_table"]
+                    and name not in seen_sources):
+                seen_sources.add(name)
+                result["source_tables"].append(name)
 
         # 컬럼 리니지 (SELECT 절)
         select = stmt.find(exp.Select)
@@ -273,9 +279,12 @@ def generate_mermaid_lineage(lineage: dict, max_cols: int = 20) -> str:
     return "\n".join(lines)
 
 
+_UNSAFE_ID_CHARS = re.compile(r"[^A-Za-z0-9_]")
+
+
 def _safe_id(name: str) -> str:
     """Mermaid 노드 ID로 안전한 문자열 반환"""
-    return re.sub(r"[^A-Za-z0-9_]", "_", name.upper())
+    return _UNSAFE_ID_CHARS.sub("_", name.upper())
 
 
 def generate_mermaid_table_lineage(lineage: dict) -> str:
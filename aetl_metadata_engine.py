@@ -48,8 +48,8 @@ _SOURCE_PATTERNS = re.compile(
 _TARGET_PATTERNS = re.compile(
     r"^(dm_|fact_|dim_|f_|d_|rpt_|agg_|mart_)", re.IGNORECASE
 )
-_SOURCE_SCHEMA_HINTS = {"ods", "stg", "staging", "raw", "source", "dw", "src"}
-_TARGET_SCHEMA_HINTS = {"dm", "mart", "marts", "analytics", "report", "bi"}
+_SOURCE_SCHEMA_HINTS = frozenset({"ods", "stg", "staging", "raw", "source", "dw", "src"})
+_TARGET_SCHEMA_HINTS = frozenset({"dm", "mart", "marts", "analytics", "report", "bi"})
 
 
 # ─────────────────────────────────────────────────────────────
@@ -178,9 +178,11 @@ def sync_schema(
         return result
 
     all_tables: dict[str, Any] = schema.get("tables", {})
+    # 대상 테이블명은 한 번만 대문자 집합으로 만들어 두고 키마다 O(1) 조회
+    wanted = None if tables is None else {t.upper() for t in tables}
     target_keys = [
         k for k in all_tables
-        if tables is None or k.upper() in [t.upper() for t in tables]
+        if wanted is None or k.upper() in wanted
     ]
 
     now_iso = datetime.now().isoformat(timespec="seconds")
@@ -192,7 +194,7 @@ def sync_schema(
         for tbl_name in target_keys:
             try:
                 info = all_tables[tbl_name]
-                pk_cols = [c.upper() for c in info.get("pk", [])]
+                pk_cols = {c.upper() for c in info.get("pk", [])}
                 fk_map: dict[str, str] = {}
                 for fk in info.get("fk", []):
                     ref = f"{fk.get('ref_table','')}.{fk.get('ref_col','')}"
@@ -281,7 +283,7 @@ def sync_profile(
     now_iso = datetime.now().isoformat(timespec="seconds")
 
     try:
-        from aetl_profiler import profile_table_from_config
+        from aetl_profiler import profile_table_from_config, top_values_records
     except ImportError as e:
         conn.close()
         result["error"].append(f"aetl_profiler 임포트 실패: {e}")
@@ -304,7 +306,7 @@ def sync_profile(
             profile = profile_table_from_config(config_path, tbl_name, top_n=10)
 
             for col in profile["columns"]:
-                top_json = json.dumps(col.get("top_values", []), ensure_ascii=False)
+                top_json = json.dumps(top_values_records(col.get("top_values")), ensure_ascii=False)
                 conn.execute("""
                     INSERT INTO meta_profiles
                         (table_name, col_name, total_cnt, null_ratio, distinct_cnt,
@@ -10,6 +10,8 @@ DB에 직접 연결하여 테이블·컬럼 통계를 수집합니다.
 """
 
 import re
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 # ─────────────────────────────────────────────────────────────
@@ -27,35 +29,71 @@ _DOMAIN_PATTERNS = [
     ("count",   r".*(cnt|count|qty|quantity).*"),
 ]
 
-def _infer_domain(col_name: str, data_type: str) -> str:
-    # 컬럼명 + 타입 패턴으로 도메인 추론.
-    cn = col_name.lower()
-    dt = data_type.lower()
-
-    # 타입 우선 체크
+# 위 패턴들을 우선순위 그대로 하나의 정규식으로 결합 — 분기마다 lookahead로 판정하고
+# 처음 성공한 분기의 빈 named group 이름(lastgroup)이 곧 도메인
+_DOMAIN_RE = re.compile(
+    "|".join(f"(?={pattern})(?P<{domain}>)" for domain, pattern in _DOMAIN_PATTERNS),
+    re.IGNORECASE,
+)
+
+# 데이터 타입 토큰 → 기본 도메인 (우선순위: date > numeric > text)
+_TYPE_TO_DOMAIN = {
+    "date": "date", "timestamp": "date", "timestamptz": "date",
+    "datetime": "date", "smalldatetime": "date",
+    "number": "numeric", "numeric": "numeric", "decimal": "numeric",
+    "float": "numeric", "double": "numeric", "int": "numeric",
+    "integer": "numeric", "bigint": "numeric", "smallint": "numeric",
+    "tinyint": "numeric", "mediumint": "numeric",
+    "char": "text", "varchar": "text", "nchar": "text", "nvarchar": "text",
+    "character": "text", "bpchar": "text", "text": "text", "clob": "text",
+    "nclob": "text", "tinytext": "text", "mediumtext": "text", "longtext": "text",
+}
+_TYPE_PRIORITY = {"date": 0, "numeric": 1, "text": 2}
+_TYPE_TOKEN_SPLIT = re.compile(r"[^a-z]+")
+
+
+def _base_type_domain(dt: str) -> str | None:
+    # 타입 문자열을 토큰 단위로 분해해 사전 조회 (varchar2(100) → varchar)
+    base = None
+    for tok in _TYPE_TOKEN_SPLIT.split(dt):
+        d = _TYPE_TO_DOMAIN.get(tok)
+        if d and (base is None or _TYPE_PRIORITY[d] < _TYPE_PRIORITY[base]):
+            base = d
+    if base is not None:
+        return base
+    # 사전에 없는 타입은 기존 부분 문자열 규칙으로 판정
     if any(t in dt for t in ("date", "timestamp", "datetime")):
         return "date"
     if any(t in dt for t in ("number", "numeric", "decimal", "float", "double", "int", "bigint")):
-        for domain, pattern in _DOMAIN_PATTERNS:
-            if re.match(pattern, cn, re.IGNORECASE):
-                return domain
         return "numeric"
     if any(t in dt for t in ("char", "varchar", "text", "clob", "nchar", "nvarchar")):
-        for domain, pattern in _DOMAIN_PATTERNS:
-            if re.match(pattern, cn, re.IGNORECASE):
-                return domain
         return "text"
-    # 기타
-    for domain, pattern in _DOMAIN_PATTERNS:
-        if re.match(pattern, cn, re.IGNORECASE):
-            return domain
-    return "unknown"
+    return None
+
+
+def _infer_domain(col_name: str, data_type: str) -> str:
+    # 컬럼명 + 타입 패턴으로 도메인 추론.
+    return _infer_domain_cached(col_name.lower(), data_type.lower())
+
+
+@lru_cache(maxsize=4096)
+def _infer_domain_cached(cn: str, dt: str) -> str:
+    # ID/NAME/REG_DT 등 반복되는 컬럼명은 캐시 적중으로 정규식 매칭 생략.
+    # 타입 우선 체크
+    base = _base_type_domain(dt)
+    if base == "date":
+        return "date"
+    m = _DOMAIN_RE.match(cn)
+    if m:
+        return m.lastgroup
+    return base or "unknown"
 
 
 # ─────────────────────────────────────────────────────────────
 # SQL 빌더
+# table_ref: 방언별로 이미 인용된 테이블 참조 ("T" / `T` / "schema"."table")
 # ─────────────────────────────────────────────────────────────
-def _build_stats_sql_oracle(table_name: str, col_name: str) -> str:
+def _build_stats_sql_oracle(table_ref: str, col_name: str) -> str:
     # Oracle용 컬럼 통계 SQL
     return f"""
 SELECT
@@ -64,10 +102,10 @@ SELECT
     COUNT(DISTINCT "{col_name}")          AS distinct_cnt,
     TO_CHAR(MIN("{col_name}"))            AS min_val,
     TO_CHAR(MAX("{col_name}"))            AS max_val
-FROM "{table_name}"
+FROM {table_ref}
 """
 
-def _build_stats_sql_mariadb(table_name: str, col_name: str) -> str:
+def _build_stats_sql_mariadb(table_ref: str, col_name: str) -> str:
     # MariaDB용 컬럼 통계 SQL
     return f"""
 SELECT
@@ -76,37 +114,37 @@ SELECT
     COUNT(DISTINCT `{col_name}`) AS distinct_cnt,
     CAST(MIN(`{col_name}`) AS CHAR) AS min_val,
     CAST(MAX(`{col_name}`) AS CHAR) AS max_val
-FROM `{table_name}`
+FROM {table_ref}
 """
 
-def _build_topval_sql_oracle(table_name: str, col_name: str, top_n: int = 10) -> str:
+def _build_topval_sql_oracle(table_ref: str, col_name: str, top_n: int = 10) -> str:
     return f"""
 SELECT TO_CHAR("{col_name}") AS val, COUNT(*) AS cnt
-FROM "{table_name}"
+FROM {table_ref}
 WHERE "{col_name}" IS NOT NULL
 GROUP BY "{col_name}"
 ORDER BY cnt DESC
 FETCH FIRST {top_n} ROWS ONLY
 """
 
-def _build_topval_sql_mariadb(table_name: str, col_name: str, top_n: int = 10) -> str:
+def _build_topval_sql_mariadb(table_ref: str, col_name: str, top_n: int = 10) -> str:
     return f"""
 SELECT CAST(`{col_name}` AS CHAR) AS val, COUNT(*) AS cnt
-FROM `{table_name}`
+FROM {table_ref}
 WHERE `{col_name}` IS NOT NULL
 GROUP BY `{col_name}`
 ORDER BY cnt DESC
 LIMIT {top_n}
 """
 
-def _build_rowcount_sql_oracle(table_name: str) -> str:
-    return f'SELECT COUNT(*) FROM "{table_name}"'
+def _build_rowcount_sql_oracle(table_ref: str) -> str:
+    return f'SELECT COUNT(*) FROM {table_ref}'
 
-def _build_rowcount_sql_mariadb(table_name: str) -> str:
-    return f"SELECT COUNT(*) FROM `{table_name}`"
+def _build_rowcount_sql_mariadb(table_ref: str) -> str:
+    return f"SELECT COUNT(*) FROM {table_ref}"
 
 
-def _build_stats_sql_postgresql(table_name: str, col_name: str) -> str:
+def _build_stats_sql_postgresql(table_ref: str, col_name: str) -> str:
     # PostgreSQL용 컬럼 통계 SQL
     return f"""
 SELECT
@@ -115,22 +153,82 @@ SELECT
     COUNT(DISTINCT "{col_name}")          AS distinct_cnt,
     CAST(MIN("{col_name}") AS TEXT)       AS min_val,
     CAST(MAX("{col_name}") AS TEXT)       AS max_val
-FROM "{table_name}"
+FROM {table_ref}
 """
 
-def _build_topval_sql_postgresql(table_name: str, col_name: str, top_n: int = 10) -> str:
+def _build_topval_sql_postgresql(table_ref: str, col_name: str, top_n: int = 10) -> str:
     # PostgreSQL용 상위 빈도값 SQL
     return f"""
 SELECT CAST("{col_name}" AS TEXT) AS val, COUNT(*) AS cnt
-FROM "{table_name}"
+FROM {table_ref}
 WHERE "{col_name}" IS NOT NULL
 GROUP BY "{col_name}"
 ORDER BY cnt DESC
 LIMIT {top_n}
 """
 
-def _build_rowcount_sql_postgresql(table_name: str) -> str:
-    return f'SELECT COUNT(*) FROM "{table_name}"'
+def _build_rowcount_sql_postgresql(table_ref: str) -> str:
+    return f'SELECT COUNT(*) FROM {table_ref}'
+
+
+# 컬럼 수가 이보다 많으면 일괄 Top Values 대신 컬럼별 쿼리 (UNION ALL 메모리 폭증 방지)
+_TOPVAL_BATCH_MAX_COLS = 50
+
+
+def _wrap_topval_batch_sql(branches: list[str], top_n: int) -> str:
+    # 컬럼별로 원래 컬럼 값 기준 집계한 (col_idx, val, cnt)를 UNION ALL로 세로 변환한 뒤
+    # ROW_NUMBER로 컬럼별 상위 N개만 남기는 단일 쿼리
+    # (문자열로 바꾼 값이 아닌 원본 컬럼으로 GROUP BY → 컬럼별 쿼리와 같은 집계 결과)
+    unpivot = "\n        UNION ALL\n        ".join(branches)
+    return f"""
+SELECT col_idx, val, cnt FROM (
+    SELECT col_idx, val, cnt,
+           ROW_NUMBER() OVER (PARTITION BY col_idx ORDER BY cnt DESC) AS rn
+    FROM (
+        {unpivot}
+    ) g
+) r
+WHERE rn <= {top_n}
+ORDER BY col_idx, rn
+"""
+
+def _build_topval_batch_sql_oracle(table_ref: str, col_names: list[str], top_n: int = 10) -> str:
+    return _wrap_topval_batch_sql([
+        f'SELECT {i} AS col_idx, TO_CHAR("{c}") AS val, COUNT(*) AS cnt '
+        f'FROM {table_ref} WHERE "{c}" IS NOT NULL GROUP BY "{c}"'
+        for i, c in enumerate(col_names)
+    ], top_n)
+
+def _build_topval_batch_sql_mariadb(table_ref: str, col_names: list[str], top_n: int = 10) -> str:
+    return _wrap_topval_batch_sql([
+        f"SELECT {i} AS col_idx, CAST(`{c}` AS CHAR) AS val, COUNT(*) AS cnt "
+        f"FROM {table_ref} WHERE `{c}` IS NOT NULL GROUP BY `{c}`"
+        for i, c in enumerate(col_names)
+    ], top_n)
+
+def _build_topval_batch_sql_postgresql(table_ref: str, col_names: list[str], top_n: int = 10) -> str:
+    return _wrap_topval_batch_sql([
+        f'SELECT {i} AS col_idx, CAST("{c}" AS TEXT) AS val, COUNT(*) AS cnt '
+        f'FROM {table_ref} WHERE "{c}" IS NOT NULL GROUP BY "{c}"'
+        for i, c in enumerate(col_names)
+    ], top_n)
+
+
+# 방언별 빌더 묶음: (rowcount, stats, topval, topval_batch)
+_SQL_BUILDERS = {
+    "oracle": (
+        _build_rowcount_sql_oracle, _build_stats_sql_oracle,
+        _build_topval_sql_oracle, _build_topval_batch_sql_oracle,
+    ),
+    "mariadb": (
+        _build_rowcount_sql_mariadb, _build_stats_sql_mariadb,
+        _build_topval_sql_mariadb, _build_topval_batch_sql_mariadb,
+    ),
+    "postgresql": (
+        _build_rowcount_sql_postgresql, _build_stats_sql_postgresql,
+        _build_topval_sql_postgresql, _build_topval_batch_sql_postgresql,
+    ),
+}
 
 
 # ─────────────────────────────────────────────────────────────
@@ -213,7 +311,7 @@ def profile_table(
               "distinct_count": int,
               "min": str | None,
               "max": str | None,
-              "top_values": [{"value": str, "count": int}, ...],
+              "top_values": {"values": [str, ...], "counts": [int, ...]},
               "inferred_domain": str
             }
           ]
@@ -230,17 +328,20 @@ def profile_table(
     if is_postgres and "." in table_name:
         pg_schema, pg_table = table_name.split(".", 1)
 
-    # 실제 SQL에 사용할 테이블 참조명 (PostgreSQL은 schema.table 형태)
-    sql_table_ref = f'"{pg_schema}"."{pg_table}"' if is_postgres else table_name
-
-    # 1. 전체 건수
+    # 방언별 빌더와 인용된 테이블 참조명은 테이블당 한 번만 결정
     if is_oracle:
-        rc_sql = _build_rowcount_sql_oracle(table_name)
+        sql_table_ref = f'"{table_name}"'
+        dialect = "oracle"
     elif is_postgres:
-        rc_sql = f'SELECT COUNT(*) FROM {sql_table_ref}'
+        sql_table_ref = f'"{pg_schema}"."{pg_table}"'
+        dialect = "postgresql"
     else:
-        rc_sql = _build_rowcount_sql_mariadb(table_name)
-    cursor.execute(rc_sql)
+        sql_table_ref = f"`{table_name}`"
+        dialect = "mariadb"
+    build_rowcount, build_stats, build_topval, build_topval_batch = _SQL_BUILDERS[dialect]
+
+    # 1. 전체 건수
+    cursor.execute(build_rowcount(sql_table_ref))
     row_count = cursor.fetchone()[0] or 0
 
     # 2. 컬럼 목록 조회
@@ -251,6 +352,29 @@ def profile_table(
     else:
         col_infos = _get_column_info_mariadb(cursor, db_name or "", table_name)
 
+    # Top Values 수집 대상 (LOB 계열 제외) — 가능하면 테이블당 한 번의 쿼리로 수집
+    topval_cols = [] if row_count <= 0 else [
+        ci["name"] for ci in col_infos
+        if not any(t in ci["type"].lower() for t in skip_topval_types)
+    ]
+    batched_topvals: dict[str, dict[str, list[Any]]] | None = None
+    if 0 < len(topval_cols) <= _TOPVAL_BATCH_MAX_COLS:
+        try:
+            cursor.execute(build_topval_batch(sql_table_ref, topval_cols, top_n))
+            batched_topvals = {c: {"values": [], "counts": []} for c in topval_cols}
+            for col_idx, val, cnt in cursor.fetchall():
+                tv = batched_topvals[topval_cols[int(col_idx)]]
+                tv["values"].append(str(val))
+                tv["counts"].append(int(cnt))
+        except Exception:
+            # 윈도 함수 미지원 등 → 컬럼별 쿼리로 fallback (PostgreSQL 트랜잭션 abort 해제)
+            batched_topvals = None
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+    topval_targets = set(topval_cols)
+
     columns = []
     for ci in col_infos:
         cname = ci["name"]
@@ -258,13 +382,7 @@ def profile_table(
 
         # 3. 컬럼 통계
         try:
-            if is_oracle:
-                stats_sql = _build_stats_sql_oracle(table_name, cname)
-            elif is_postgres:
-                stats_sql = _build_stats_sql_postgresql(sql_table_ref, cname)
-            else:
-                stats_sql = _build_stats_sql_mariadb(table_name, cname)
-            cursor.execute(stats_sql)
+            cursor.execute(build_stats(sql_table_ref, cname))
             row = cursor.fetchone()
             total_cnt    = int(row[0]) if row[0] else 0
             non_null_cnt = int(row[1]) if row[1] else 0
@@ -277,18 +395,17 @@ def profile_table(
             min_val = max_val = None
 
         # 4. Top Values (LOB 계열 제외)
-        top_values: list[dict[str, Any]] = []
-        skip = any(t in ctype.lower() for t in skip_topval_types)
-        if not skip and row_count > 0:
+        top_values: dict[str, list[Any]] = {"values": [], "counts": []}
+        if batched_topvals is not None:
+            top_values = batched_topvals.get(cname, top_values)
+        elif cname in topval_targets:
             try:
-                if is_oracle:
-                    tv_sql = _build_topval_sql_oracle(table_name, cname, top_n)
-                elif is_postgres:
-                    tv_sql = _build_topval_sql_postgresql(sql_table_ref, cname, top_n)
-                else:
-                    tv_sql = _build_topval_sql_mariadb(table_name, cname, top_n)
-                cursor.execute(tv_sql)
-                top_values = [{"value": str(r[0]), "count": int(r[1])} for r in cursor.fetchall()]
+                cursor.execute(build_topval(sql_table_ref, cname, top_n))
+                tv_rows = cursor.fetchall()
+                top_values = {
+                    "values": [str(r[0]) for r in tv_rows],
+                    "counts": [int(r[1]) for r in tv_rows],
+                }
             except Exception:
                 pass
 
@@ -370,16 +487,27 @@ def profile_table_from_config(
     return result
 
 
+def top_values_records(top_values) -> list[dict]:
+    """
+    top_values(SoA: {"values": [...], "counts": [...]})를
+    [{"value": str, "count": int}, ...] 레코드 목록으로 변환합니다.
+    JSON 저장·화면 표시 직전에 한 번만 호출합니다. 기존 레코드 목록은 그대로 반환합니다.
+    """
+    if isinstance(top_values, dict):
+        return [
+            {"value": v, "count": c}
+            for v, c in zip(top_values.get("values", []), top_values.get("counts", []))
+        ]
+    return list(top_values or [])
+
+
 def profile_summary_text(profile: dict) -> str:
     """
     프로파일 결과를 LLM 프롬프트용 간결한 텍스트로 변환합니다.
     """
-    lines = [f"[{profile['table_name']}] row_count={profile['row_count']:,}"]
-    for c in profile["columns"]:
-        null_str = f"null={c['null_pct']*100:.1f}%" if c["null_pct"] > 0 else "null=0%"
-        domain   = c["inferred_domain"]
-        lines.append(
-            f"  {c['name']} ({c['type']}) | {null_str} | distinct={c['distinct_count']} "
-            f"| domain={domain} | range=[{c['min']} ~ {c['max']}]"
-        )
-    return "\n".join(lines)
+    header = f"[{profile['table_name']}] row_count={profile['row_count']:,}"
+    return "\n".join(chain((header,), (
+        f"  {c['name']} ({c['type']}) | null={c['null_pct']*100:.1f}% | distinct={c['distinct_count']} "
+        f"| domain={c['inferred_domain']} | range=[{c['min']} ~ {c['max']}]"
+        for c in profile["columns"]
+    )))
@@ -9,12 +9,15 @@ DB 파일: aetl_metadata.db (프로젝트 루트)
 ================================================================================
 """
 
+import hashlib
 import json
+import os
 import sqlite3
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+
+from aetl_profiler import top_values_records
 
 DB_PATH = Path(__file__).parent / "aetl_metadata.db"
 
@@ -90,6 +93,9 @@ CREATE INDEX IF NOT EXISTS idx_tbl_source ON table_meta(source_id);
 CREATE INDEX IF NOT EXISTS idx_col_table  ON column_meta(table_id);
 CREATE INDEX IF NOT EXISTS idx_vr_exec    ON validation_result(execution_id);
 CREATE INDEX IF NOT EXISTS idx_vr_rule    ON validation_result(rule_id);
+CREATE INDEX IF NOT EXISTS idx_vr_exec_status ON validation_result(execution_id, status);
+CREATE INDEX IF NOT EXISTS idx_vrule_target   ON validation_rule(target_table);
+CREATE INDEX IF NOT EXISTS idx_vrule_source   ON validation_rule(source_table);
 """
 
 
@@ -101,10 +107,38 @@ def _conn(db_path: Path = DB_PATH) -> sqlite3.Connection:
     return conn
 
 
+# DDL 지문 — PRAGMA user_version(32bit signed)에 저장해 스키마가 바뀔 때만 DDL 재실행
+_DDL_VERSION = int.from_bytes(
+    hashlib.blake2b(_DDL.encode("utf-8"), digest_size=4).digest(), "big"
+) & 0x7FFFFFFF
+
+# 현 프로세스에서 초기화를 마친 DB 경로 → 그때의 파일 식별값 (st_dev, st_ino)
+# (실행 중 DB 파일이 삭제·교체되면 식별값이 달라져 다시 초기화됨)
+_initialized_paths: dict[str, tuple[int, int]] = {}
+
+
+def _db_file_id(db_path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
 def init_db(db_path: Path = DB_PATH):
     """DB 초기화 (테이블 생성). 이미 존재하면 무시."""
+    key = str(db_path)
+    file_id = _db_file_id(db_path)
+    if file_id is not None and _initialized_paths.get(key) == file_id:
+        return
     with _conn(db_path) as conn:
-        conn.executescript(_DDL)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != _DDL_VERSION:
+            conn.executescript(_DDL)
+            conn.execute(f"PRAGMA user_version = {_DDL_VERSION}")
+            conn.execute("ANALYZE")
+    file_id = _db_file_id(db_path)
+    if file_id is not None:
+        _initialized_paths[key] = file_id
 
 
 # ─────────────────────────────────────────────────────────────
@@ -193,7 +227,7 @@ def save_profile(table_profile: dict, source_id: int) -> int:
                 col.get("distinct_count"),
                 col.get("min"),
                 col.get("max"),
-                json.dumps(col.get("top_values", []), ensure_ascii=False),
+                json.dumps(top_values_records(col.get("top_values")), ensure_ascii=False),
                 col.get("inferred_domain"),
             ))
 
@@ -271,14 +305,20 @@ def list_validation_rules(
 ) -> list[dict]:
     """검증 규칙 목록 조회."""
     init_db()
-    sql = "SELECT * FROM validation_rule WHERE 1=1"
-    params: list[Any] = []
-    if active_only:
-        sql += " AND is_active=1"
+    active = " AND is_active=1" if active_only else ""
     if target_table:
-        sql += " AND (target_table=? OR source_table=?)"
-        params += [target_table, target_table]
-    sql += " ORDER BY tier, rule_id"
+        # OR 대신 UNION ALL — 분기별로 target/source 인덱스 사용 (양쪽 일치 행은 1회만)
+        sql = f"""
+            SELECT * FROM validation_rule WHERE target_table=?{active}
+            UNION ALL
+            SELECT * FROM validation_rule
+            WHERE source_table=? AND target_table IS NOT ?{active}
+            ORDER BY tier, rule_id
+        """
+        params: tuple = (target_table, target_table, target_table)
+    else:
+        sql = f"SELECT * FROM validation_rule WHERE 1=1{active} ORDER BY tier, rule_id"
+        params = ()
 
     with _conn() as conn:
         rows = conn.execute(sql, params).fetchall()
@@ -332,17 +372,27 @@ def get_validation_history(
 ) -> list[dict]:
     """최근 검증 실행 이력을 반환합니다."""
     init_db()
-    sql = """
+    select = """
         SELECT vr.*, r.rule_type, r.tier, r.severity
         FROM validation_result vr
-        LEFT JOIN validation_rule r ON vr.rule_id = r.rule_id
-        WHERE 1=1
     """
-    params: list[Any] = []
     if table_name:
-        sql += " AND (r.target_table=? OR r.source_table=?)"
-        params += [table_name, table_name]
-    sql += f" ORDER BY vr.run_timestamp DESC LIMIT {limit}"
+        # 테이블 조건이 규칙 컬럼에 걸리므로 INNER JOIN + 분기별 인덱스 사용
+        sql = f"""
+            {select} JOIN validation_rule r ON vr.rule_id = r.rule_id
+            WHERE r.target_table=?
+            UNION ALL
+            {select} JOIN validation_rule r ON vr.rule_id = r.rule_id
+            WHERE r.source_table=? AND r.target_table IS NOT ?
+            ORDER BY run_timestamp DESC LIMIT ?
+        """
+        params: tuple = (table_name, table_name, table_name, limit)
+    else:
+        sql = f"""
+            {select} LEFT JOIN validation_rule r ON vr.rule_id = r.rule_id
+            ORDER BY vr.run_timestamp DESC LIMIT ?
+        """
+        params = (limit,)
 
     with _conn() as conn:
         rows = conn.execute(sql, params).fetchall()
@@ -358,7 +408,7 @@ def get_execution_summary(execution_id: str) -> dict:
     with _conn() as conn:
         rows = conn.execute("""
             SELECT status, COUNT(*) AS cnt
-            FROM validation_result
+            FROM validation_result INDEXED BY idx_vr_exec_status
             WHERE execution_id=?
             GROUP BY status
         """, (execution_id,)).fetchall()
@@ -20,14 +20,28 @@ from __future__ import annotations
 
 import io
 import json
+import os
+import re
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import openpyxl
 
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
+
 PROFILE_DIR = Path(__file__).parent / ".template_profiles"
 
+# apply_profile 결과 직렬화 시 메모리에 둘 최대 크기 (초과분은 임시 파일로 spool)
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
 # ─────────────────────────────────────────────────────────────
 # AETL 표준 필드 목록  (사용자가 헤더와 연결할 수 있는 필드들)
 # ─────────────────────────────────────────────────────────────
@@ -75,25 +89,43 @@ def detect_template_structure(file_bytes: bytes) -> dict[str, Any]:
           }
         }
     """
-    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), data_only=True)
+    # 읽기 전용(스트리밍) 모드 — 헤더·샘플 몇 행만 읽으므로 전체 셀 객체를 만들지 않음
+    wb = openpyxl.load_workbook(io.BytesIO(file_bytes), data_only=True, read_only=True)
+    try:
+        return _detect_sheets(wb)
+    finally:
+        wb.close()
+
+
+def _detect_sheets(wb) -> dict[str, Any]:
     result: dict[str, Any] = {}
 
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
+        # 읽기 전용 시트는 dimension 정보가 없으면 크기가 None → 시트 전체를 스캔하지 않고
+        # 아래에서 실제로 읽은 행으로 보정
+        stored_rows, stored_cols = ws.max_row, ws.max_column
         headers: list[dict] = []
-        header_row = 1
+
+        # 헤더 후보(1~5행)와 샘플(헤더 다음 최대 3행)을 한 번의 순방향 스캔(최대 8행)으로 읽음
+        # — 읽기 전용 모드는 iter_rows 호출마다 시트 XML을 처음부터 다시 파싱함
+        # 저장된 <dimension>은 작성 도구에 따라 "A1"처럼 틀릴 수 있고 iter_rows는 이를 열 상한으로
+        # 쓰므로, dimension을 지우고 각 행을 실제 마지막 셀까지 읽은 뒤 크기를 보정
+        ws.reset_dimensions()
+        rows = list(ws.iter_rows(min_row=1, max_row=8, values_only=True))
+        max_row = max(stored_rows or 1, len(rows))
+        max_col = max(stored_cols or 1, max((len(r) for r in rows), default=1))
 
         # 첫 5행에서 가장 많은 값을 가진 행을 헤더 행으로 판단
-        best_row, best_count = 1, 0
-        for r in range(1, 6):
-            count = sum(1 for c in range(1, ws.max_column + 1)
-                        if ws.cell(row=r, column=c).value is not None)
-            if count > best_count:
-                best_count, best_row = count, r
-        header_row = best_row
-
-        for col in range(1, ws.max_column + 1):
-            val = ws.cell(row=header_row, column=col).value
+        top_rows = rows[:5]
+        best_idx = max(
+            range(len(top_rows)),
+            key=lambda i: sum(v is not None for v in top_rows[i]),
+            default=0,
+        )
+        header_row = best_idx + 1
+
+        for col, val in enumerate(top_rows[best_idx] if top_rows else (), start=1):
             if val is not None and str(val).strip():
                 headers.append({
                     "cell_value": str(val).strip(),
@@ -102,23 +134,50 @@ def detect_template_structure(file_bytes: bytes) -> dict[str, Any]:
                 })
 
         # 샘플 데이터 (헤더 다음 최대 3행)
-        sample_rows = []
-        for r in range(header_row + 1, min(header_row + 4, ws.max_row + 1)):
-            row_vals = [ws.cell(row=r, column=c).value for c in range(1, ws.max_column + 1)]
-            if any(v is not None for v in row_vals):
-                sample_rows.append([str(v) if v is not None else "" for v in row_vals])
+        sample_rows = [
+            [str(v) if v is not None else "" for v in row_vals]
+            for row_vals in rows[header_row:min(header_row + 3, max_row)]
+            if any(v is not None for v in row_vals)
+        ]
 
         result[sheet_name] = {
             "headers":    headers,
             "header_row": header_row,
-            "max_row":    ws.max_row,
-            "max_col":    ws.max_column,
+            "max_row":    max_row,
+            "max_col":    max_col,
             "sample_rows": sample_rows,
         }
 
     return result
 
 
+# 헤더 키워드 → AETL 필드 (위에서부터 먼저 일치하는 필드 채택)
+_KEYWORD_MAP: list[tuple[list[str], str]] = [
+    (["타겟 컬럼", "target col", "대상 컬럼", "목적 컬럼", "적재 컬럼"], "target_col"),
+    (["소스 컬럼", "source col", "원천 컬럼", "원본 컬럼"], "source_col"),
+    (["변환", "transform", "변환식", "변환규칙", "매핑규칙", "규칙"], "transform_rule"),
+    (["변환유형", "transform type", "매핑유형", "유형"], "transform_type"),
+    (["비고", "remark", "설명", "description", "comment"], "col_description"),
+    (["매핑id", "mapping id", "매핑번호"], "mapping_id"),
+    (["작성자", "author", "담당자"], "author"),
+    (["작성일", "created", "작성일자", "일자"], "created_date"),
+    (["소스테이블", "source table", "원천테이블"], "source_table"),
+    (["타겟테이블", "target table", "대상테이블", "적재테이블"], "target_table"),
+    (["적재sql", "load sql", "적재쿼리"], "load_sql"),
+    (["검증sql", "validation sql", "검증쿼리"], "validation_sql"),
+    (["적재유형", "load type", "적재방식"], "load_type"),
+]
+
+# 공백·밑줄 제거 테이블 (str.translate 한 번으로 정규화)
+_HEADER_STRIP = str.maketrans("", "", " _")
+
+# 필드별 키워드를 정규화 후 하나의 alternation 정규식으로 미리 컴파일
+_KEYWORD_PATTERNS: list[tuple[re.Pattern, str]] = [
+    (re.compile("|".join(re.escape(kw.translate(_HEADER_STRIP)) for kw in keywords)), field)
+    for keywords, field in _KEYWORD_MAP
+]
+
+
 def suggest_field_mapping(headers: list[dict]) -> dict[str, str]:
     """
     헤더 텍스트를 기반으로 AETL 필드 매핑을 휴리스틱으로 제안합니다.
@@ -127,39 +186,38 @@ def suggest_field_mapping(headers: list[dict]) -> dict[str, str]:
     Returns:
         {col_index_str: field_name}  예: {"3": "target_col", "5": "source_col"}
     """
-    KEYWORD_MAP: list[tuple[list[str], str]] = [
-        (["타겟 컬럼", "target col", "대상 컬럼", "목적 컬럼", "적재 컬럼"], "target_col"),
-        (["소스 컬럼", "source col", "원천 컬럼", "원본 컬럼"], "source_col"),
-        (["변환", "transform", "변환식", "변환규칙", "매핑규칙", "규칙"], "transform_rule"),
-        (["변환유형", "transform type", "매핑유형", "유형"], "transform_type"),
-        (["비고", "remark", "설명", "description", "comment"], "col_description"),
-        (["매핑id", "mapping id", "매핑번호"], "mapping_id"),
-        (["작성자", "author", "담당자"], "author"),
-        (["작성일", "created", "작성일자", "일자"], "created_date"),
-        (["소스테이블", "source table", "원천테이블"], "source_table"),
-        (["타겟테이블", "target table", "대상테이블", "적재테이블"], "target_table"),
-        (["적재sql", "load sql", "적재쿼리"], "load_sql"),
-        (["검증sql", "validation sql", "검증쿼리"], "validation_sql"),
-        (["적재유형", "load type", "적재방식"], "load_type"),
-    ]
+    return {
+        str(h["col"]): _match_field(h["cell_value"].lower().translate(_HEADER_STRIP))
+        for h in headers
+    }
 
-    result: dict[str, str] = {}
-    for h in headers:
-        val_lower = h["cell_value"].lower().replace(" ", "").replace("_", "")
-        matched = "__ignore__"
-        for keywords, field in KEYWORD_MAP:
-            if any(kw.replace(" ", "").replace("_", "") in val_lower for kw in keywords):
-                matched = field
-                break
-        result[str(h["col"])] = matched
 
-    return result
+@lru_cache(maxsize=1024)
+def _match_field(norm: str) -> str:
+    # 정규화된 헤더 텍스트 → 필드명. 키워드 표가 고정이므로 프로세스 내 캐시 안전
+    for pattern, field in _KEYWORD_PATTERNS:
+        if pattern.search(norm):
+            return field
+    return "__ignore__"
 
 
 # ─────────────────────────────────────────────────────────────
 # 2. 프로파일 저장 / 로드
 # ─────────────────────────────────────────────────────────────
 
+def _dump_profile_json(profile_data: dict) -> bytes:
+    # profile.json 직렬화 (UTF-8, 들여쓰기 2칸)
+    if orjson is not None:
+        return orjson.dumps(profile_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(profile_data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _load_profile_json(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def save_profile(
     profile_name: str,
     sheet_configs: list[dict],
@@ -191,10 +249,23 @@ def save_profile(
     profile_path  = PROFILE_DIR / f"{profile_name}.json"
     template_path = PROFILE_DIR / f"{profile_name}_template.xlsx"
 
-    with open(profile_path, "w", encoding="utf-8") as f:
-        json.dump(profile_data, f, ensure_ascii=False, indent=2)
-    with open(template_path, "wb") as f:
-        f.write(template_bytes)
+    # 템플릿 → JSON 순서로 교체: JSON이 보이는 시점엔 템플릿이 항상 완전한 상태
+    _atomic_write(template_path, template_bytes)
+    _atomic_write(profile_path, _dump_profile_json(profile_data))
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """임시 파일에 기록·fsync 후 os.replace로 교체 (중간 실패 시 기존 파일 유지)"""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_profile(profile_name: str) -> tuple[dict | None, bytes]:
@@ -202,29 +273,66 @@ def load_profile(profile_name: str) -> tuple[dict | None, bytes]:
     Returns:
         (profile_data, template_bytes)
         profile_data가 None이면 프로파일이 없는 것
+
+    파일 mtime 기준으로 캐시되므로 반환된 profile_data는 수정하지 말고 읽기 전용으로 사용합니다.
     """
     profile_path  = PROFILE_DIR / f"{profile_name}.json"
     template_path = PROFILE_DIR / f"{profile_name}_template.xlsx"
 
-    if not profile_path.exists():
+    try:
+        json_mtime = profile_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return None, b""
+    try:
+        template_mtime = template_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        template_mtime = None
+
+    return _load_profile_cached(profile_name, json_mtime, template_mtime)
+
+
+@lru_cache(maxsize=32)
+def _load_profile_cached(
+    profile_name: str,
+    json_mtime: int,
+    template_mtime: int | None,
+) -> tuple[dict, bytes]:
+    # mtime이 키에 포함되므로 파일이 바뀌면 자동으로 다시 읽음
+    profile_path  = PROFILE_DIR / f"{profile_name}.json"
+    template_path = PROFILE_DIR / f"{profile_name}_template.xlsx"
 
-    with open(profile_path, encoding="utf-8") as f:
-        profile_data = json.load(f)
+    with open(profile_path, "rb") as f:
+        profile_data = _load_profile_json(f.read())
 
     template_bytes = b""
-    if template_path.exists():
+    if template_mtime is not None:
         with open(template_path, "rb") as f:
             template_bytes = f.read()
 
     return profile_data, template_bytes
 
 
+# (PROFILE_DIR mtime_ns, 프로파일 이름 목록) — 파일 추가/삭제 시 디렉터리 mtime이 바뀌어 무효화
+_profiles_cache: tuple[int, list[str]] | None = None
+
+
 def list_profiles() -> list[str]:
     """저장된 프로파일 이름 목록을 반환합니다."""
-    if not PROFILE_DIR.exists():
+    global _profiles_cache
+    try:
+        mtime = PROFILE_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted(p.stem for p in PROFILE_DIR.glob("*.json"))
+    if _profiles_cache is not None and _profiles_cache[0] == mtime:
+        return list(_profiles_cache[1])
+
+    with os.scandir(PROFILE_DIR) as it:
+        names = sorted(
+            e.name[:-5] for e in it
+            if e.name.endswith(".json") and e.is_file()
+        )
+    _profiles_cache = (mtime, names)
+    return list(names)
 
 
 def delete_profile(profile_name: str) -> bool:
@@ -267,17 +375,20 @@ def apply_profile(
     Returns:
         기입 완료된 xlsx bytes
     """
-    wb = openpyxl.load_workbook(io.BytesIO(template_bytes))
+    # 기입 대상 시트가 양식에 하나도 없으면 load/save 없이 원본 그대로 반환
+    target_sheets = {c.get("sheet_name", "") for c in profile_data.get("sheet_configs", [])}
+    template_sheets = _template_sheet_names(template_bytes)
+    if template_sheets is not None and not (target_sheets & template_sheets):
+        return template_bytes
 
-    # 단일값 조회 테이블
-    single_values: dict[str, str] = {
-        "mapping_id":   mapping_result.get("mapping_id", ""),
-        "author":       mapping_result.get("author", "AETL"),
-        "created_date": datetime.now().strftime("%Y-%m-%d"),
-        "source_table": mapping_result.get("source_meta", {}).get("table_name", ""),
-        "target_table": mapping_result.get("target_meta", {}).get("table_name", ""),
-        "load_type":    mapping_result.get("load_type", "MERGE"),
-    }
+    # VBA 파트는 write-back에 쓰이지 않으므로 파싱/재직렬화하지 않음.
+    # 외부 링크(keep_links)는 유지 — 버리면 다른 통합문서를 참조하는 수식([1]Sheet!A1)의 대상이 사라짐.
+    # 수식은 그대로 보존해야 하므로 data_only는 기본값(False) 유지.
+    wb = openpyxl.load_workbook(io.BytesIO(template_bytes), keep_vba=False)
+
+    # 단일값 조회 테이블 / 검증 SQL 묶음 — 필요한 시트가 있을 때 호출당 한 번만 생성
+    single_values: dict[str, str] | None = None
+    combined_validation: str | None = None
 
     column_mappings  = mapping_result.get("column_mappings", [])
     load_sql         = mapping_result.get("load_sql", "")
@@ -293,6 +404,8 @@ def apply_profile(
         col_field  = {int(k): v for k, v in cfg.get("col_field_map", {}).items()}
 
         if sheet_type == "overview":
+            if single_values is None:
+                single_values = _overview_values(mapping_result)
             _writeback_overview(ws, col_field, single_values, cfg)
 
         elif sheet_type == "column_mapping":
@@ -304,30 +417,63 @@ def apply_profile(
 
         elif sheet_type == "sql_validation":
             pos = cfg.get("sql_cell", {"row": 2, "col": 1})
-            combined = "\n\n".join(
-                f"-- {s.get('name','')}\n{s.get('sql','')}"
-                for s in validation_sqls
-            )
-            ws.cell(row=pos["row"], column=pos["col"], value=combined)
+            if combined_validation is None:
+                combined_validation = "\n\n".join(
+                    f"-- {s.get('name','')}\n{s.get('sql','')}"
+                    for s in validation_sqls
+                )
+            ws.cell(row=pos["row"], column=pos["col"], value=combined_validation)
+
+    # 큰 결과물은 디스크로 넘겨 직렬화 버퍼와 반환 bytes가 동시에 메모리에 머물지 않게 함
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as tf:
+        wb.save(tf)
+        tf.seek(0)
+        return tf.read()
+
+
+_SHEET_TAG = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet"
+
+
+def _template_sheet_names(template_bytes: bytes) -> set[str] | None:
+    """
+    xlsx(zip)의 xl/workbook.xml만 읽어 시트 이름 집합을 반환합니다.
+    워크북 전체를 파싱하지 않으며, 읽을 수 없는 파일이면 None (openpyxl에 판단 위임).
+    """
+    try:
+        with zipfile.ZipFile(io.BytesIO(template_bytes)) as zf:
+            root = ET.fromstring(zf.read("xl/workbook.xml"))
+    except (zipfile.BadZipFile, KeyError, ET.ParseError):
+        return None
+    return {el.get("name", "") for el in root.iter(_SHEET_TAG)}
 
-    buf = io.BytesIO()
-    wb.save(buf)
-    return buf.getvalue()
+
+def _overview_values(mapping_result: dict) -> dict[str, str]:
+    """개요형 시트에 기입할 단일값 조회 테이블 (작성일은 호출 시점 기준)"""
+    return {
+        "mapping_id":   mapping_result.get("mapping_id", ""),
+        "author":       mapping_result.get("author", "AETL"),
+        "created_date": datetime.now().strftime("%Y-%m-%d"),
+        "source_table": mapping_result.get("source_meta", {}).get("table_name", ""),
+        "target_table": mapping_result.get("target_meta", {}).get("table_name", ""),
+        "load_type":    mapping_result.get("load_type", "MERGE"),
+    }
 
 
 def _writeback_overview(ws, col_field: dict, single_values: dict, cfg: dict):
     """개요형 시트: 헤더 옆(오른쪽) 또는 아래 셀에 단일값 기입"""
     header_row = cfg.get("header_row", 1)
 
+    # 헤더가 세로 배치(A열 레이블, B열 값)인지 가로 배치인지 판단
+    # 헤더 행의 컬럼이 2개 이하면 세로(레이블-값 형) → 같은 행 오른쪽 열에 기입
+    # 그 외(가로 테이블 헤더)면 다음 행에 기입
+    headers_in_row = sum(1 for f in col_field.values() if f and f != "__ignore__")
+    vertical = headers_in_row <= 3
+
     for col_idx, field_name in col_field.items():
         if field_name in ("__ignore__", "") or field_name not in single_values:
             continue
         value = single_values[field_name]
-        # 헤더가 세로 배치(A열 레이블, B열 값)인지 가로 배치인지 판단
-        # 헤더 행의 컬럼이 2개 이하면 세로(레이블-값 형) → 같은 행 오른쪽 열에 기입
-        # 그 외(가로 테이블 헤더)면 다음 행에 기입
-        headers_in_row = sum(1 for c, f in col_field.items() if f and f != "__ignore__")
-        if headers_in_row <= 3:
+        if vertical:
             # 세로형: 레이블 오른쪽에 값 기입
             ws.cell(row=header_row + (col_idx - 1), column=col_idx + 1, value=value)
         else:
@@ -335,20 +481,32 @@ def _writeback_overview(ws, col_field: dict, single_values: dict, cfg: dict):
             ws.cell(row=header_row + 1, column=col_idx, value=value)
 
 
+# 컬럼 매핑 행 필드 → (column_mappings 키, 기본값)
+_ROW_FIELD_SOURCES: dict[str, tuple[str, str]] = {
+    "target_col":      ("target_col", ""),
+    "source_col":      ("source_col", ""),
+    "transform_rule":  ("transform", ""),
+    "transform_type":  ("transform_type", "1:1"),
+    "col_description": ("description", ""),
+}
+
+
 def _writeback_column_mapping(ws, col_field: dict, column_mappings: list[dict], cfg: dict):
     """컬럼 매핑형 시트: data_start_row부터 한 행씩 반복 기입"""
     data_start = cfg.get("data_start_row", cfg.get("header_row", 1) + 1)
 
-    row_field_value: dict[str, str]
-    for i, mapping in enumerate(column_mappings):
-        row = data_start + i
-        row_field_value = {
-            "target_col":      mapping.get("target_col", ""),
-            "source_col":      mapping.get("source_col", ""),
-            "transform_rule":  mapping.get("transform", ""),
-            "transform_type":  mapping.get("transform_type", "1:1"),
-            "col_description": mapping.get("description", ""),
-        }
-        for col_idx, field_name in col_field.items():
-            if field_name in row_field_value:
-                ws.cell(row=row, column=col_idx, value=row_field_value[field_name])
+    # 기입 대상 열을 열 순서로 한 번만 정리 → 매핑마다 고정 폭 값 튜플 생성
+    targets = [
+        (col_idx, _ROW_FIELD_SOURCES[field_name])
+        for col_idx, field_name in sorted(col_field.items())
+        if field_name in _ROW_FIELD_SOURCES
+    ]
+    if not targets:
+        return
+    target_cols = [col_idx for col_idx, _ in targets]
+    sources     = [src for _, src in targets]
+
+    for row, mapping in enumerate(column_mappings, start=data_start):
+        values = tuple(mapping.get(key, default) for key, default in sources)
+        for col_idx, value in zip(target_cols, values):
+            ws.cell(row=row, column=col_idx, value=value)
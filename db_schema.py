@@ -16,25 +16,115 @@
 ================================================================================
 """
 
+import copy
+import gzip
+import importlib
 import json
 import os
 import re
+import threading
 import time
+import zlib
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # 미설치 시 표준 json 사용
+    orjson = None
+
 
 # =============================================================================
 # 상수 정의
 # =============================================================================
 CONFIG_FILE = "db_config.json"
 CACHE_FILE = ".schema_cache.json"
+# 직렬화 결과가 이 크기(바이트)를 넘으면 캐시 파일을 gzip으로 압축 저장
+CACHE_GZIP_THRESHOLD = 256 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+# include_tables를 SQL IN 목록으로 넘길 때 한 목록의 최대 항목 수 (Oracle 한도)
+IN_LIST_MAX = 1000
+
+
+# =============================================================================
+# JSON 직렬화 (orjson 우선)
+# =============================================================================
+def _dumps_json(obj: Any, sort_keys: bool = False) -> bytes:
+    """설정/캐시용 JSON을 공백 없는 UTF-8 바이트로 직렬화 (sort_keys: 해시용 정렬 출력)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:  # 64bit 초과 정수 등 orjson 미지원 값
+            pass
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def _loads_json(raw: bytes) -> Any:
+    # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스 → 호출부 예외 처리 그대로 유효
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 # =============================================================================
 # 설정 파일 로드
 # =============================================================================
+# ${VAR_NAME} 참조 — 문자열 전체("${DB_PASSWORD}")와 문자열 내부("host:${PORT}/db") 모두 치환
+_ENV_RE = re.compile(r"\$\{([^}]+)\}")
+
+
+def _env_sub(m: re.Match) -> str:
+    """정의되지 않은 환경변수는 원문(${VAR})을 그대로 둡니다."""
+    return os.environ.get(m.group(1), m.group(0))
+
+
+def _replace_env_vars(obj):
+    """
+    JSON 트리의 문자열 값에서 환경변수 참조를 치환한 사본을 반환합니다.
+    재귀 대신 (원본, 사본) 스택으로 순회하므로 깊은 설정에서도 재귀 한도에 걸리지 않습니다.
+    """
+    if isinstance(obj, str):
+        return _ENV_RE.sub(_env_sub, obj) if "${" in obj else obj
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root = {} if isinstance(obj, dict) else [None] * len(obj)
+    stack = [(obj, root)]
+    while stack:
+        src, dst = stack.pop()
+        for key, value in (src.items() if isinstance(src, dict) else enumerate(src)):
+            if isinstance(value, str):
+                if "${" in value:
+                    value = _ENV_RE.sub(_env_sub, value)
+            elif isinstance(value, dict):
+                copied = {}
+                stack.append((value, copied))
+                value = copied
+            elif isinstance(value, list):
+                copied = [None] * len(value)
+                stack.append((value, copied))
+                value = copied
+            dst[key] = value
+    return root
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    설정 파일 JSON 파싱 결과 캐시 (파일 수정 시각이 바뀌면 새 키로 다시 읽음).
+    반환값은 공유되므로 직접 수정하지 말 것 — load_config가 치환하며 새 객체를 만듭니다.
+    """
+    with open(config_path, "rb") as f:
+        return _loads_json(f.read())
+
+
 def load_config(config_path: str = CONFIG_FILE) -> Dict[str, Any]:
     """
     설정 파일을 로드합니다.
@@ -46,23 +136,47 @@ def load_config(config_path: str = CONFIG_FILE) -> Dict[str, Any]:
     Returns:
         설정 딕셔너리
     """
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
-
-    # 환경변수 치환 (${VAR_NAME} 형태)
-    def replace_env_vars(obj):
-        if isinstance(obj, str):
-            if obj.startswith("${") and obj.endswith("}"):
-                var_name = obj[2:-1]
-                return os.environ.get(var_name, obj)
-            return obj
-        elif isinstance(obj, dict):
-            return {k: replace_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [replace_env_vars(item) for item in obj]
-        return obj
+    config = _load_config_cached(config_path, os.stat(config_path).st_mtime_ns)
 
-    return replace_env_vars(config)
+    # 환경변수 치환 (매 호출 새 dict/list를 만들므로 캐시된 원본은 변하지 않음)
+    return _replace_env_vars(config)
+
+
+# =============================================================================
+# DB 드라이버 지연 로드
+# =============================================================================
+_DRIVERS: Dict[str, Any] = {}
+
+
+def _import_driver(module_name: str, pip_name: str):
+    """
+    DB 드라이버 모듈을 처음 필요할 때 한 번만 import하고 이후엔 캐시된 모듈을 반환합니다.
+    미설치 시 설치 안내와 함께 ImportError를 발생시킵니다.
+    """
+    module = _DRIVERS.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            raise ImportError(f"{module_name} 패키지가 설치되지 않았습니다. pip install {pip_name}")
+        _DRIVERS[module_name] = module
+    return module
+
+
+# 연결 풀 (접속 정보별 1개) — 같은 프로세스에서 스키마를 여러 번 조회할 때 TCP/인증 핸드셰이크 재사용
+_POOL_SIZE = 8
+_POOLS: Dict[tuple, Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(key: tuple, create):
+    """key에 해당하는 연결 풀을 반환합니다. 없으면 create()로 만들어 보관합니다."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = create()
+            _POOLS[key] = pool
+        return pool
 
 
 # =============================================================================
@@ -74,6 +188,9 @@ class SchemaFetcher(ABC):
     Oracle, MariaDB 등 각 DB별로 구현체를 제공
     """
 
+    # True면 get_tables()가 include/exclude를 SQL WHERE로 이미 적용 → filter_tables 생략
+    filters_in_sql = False
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.conn = None
@@ -82,6 +199,10 @@ class SchemaFetcher(ABC):
         self.owner = self.schema_options.get("owner")
         self.include_tables = self.schema_options.get("include_tables", [])
         self.exclude_tables = self.schema_options.get("exclude_tables", [])
+        # include 비교용 대문자 이름 집합 (설정은 인스턴스 수명 동안 바뀌지 않으므로 한 번만 생성)
+        self._include_upper = (
+            frozenset(t.upper() for t in self.include_tables) if self.include_tables else None
+        )
         self.include_views = self.schema_options.get("include_views", False)
 
     @abstractmethod
@@ -130,37 +251,149 @@ class SchemaFetcher(ABC):
         result = tables
 
         # include 필터링
-        if self.include_tables:
-            include_set = set(t.upper() for t in self.include_tables)
-            result = [t for t in result if t.upper() in include_set]
+        if self._include_upper:
+            include_upper = self._include_upper
+            result = [t for t in result if t.upper() in include_upper]
 
-        # exclude 필터링
+        # exclude 필터링: 와일드카드 없는 이름은 집합 조회, 나머지 패턴은 하나의 정규식으로 한 번만 순회
         if self.exclude_tables:
-            for pattern in self.exclude_tables:
-                # SQL LIKE 패턴을 정규표현식으로 변환
-                regex = "^" + pattern.replace("%", ".*").replace("_", ".") + "$"
-                result = [t for t in result if not re.match(regex, t, re.IGNORECASE)]
+            exclude_names, exclude_re = self._exclude_matchers()
+            if exclude_names:
+                result = [t for t in result if t.upper() not in exclude_names]
+            if exclude_re is not None:
+                result = [t for t in result if not exclude_re.match(t)]
 
         return result
 
+    def _exclude_matchers(self) -> tuple:
+        """
+        exclude 패턴(SQL LIKE)을 (리터럴 이름 집합, ^(?:p1|p2|...)$ 정규식 | None)으로 분리합니다.
+        목록이 바뀌지 않으면 이전에 만든 결과를 재사용합니다.
+        """
+        key = tuple(self.exclude_tables)
+        cached = getattr(self, "_exclude_cache", None)
+        if cached is None or cached[0] != key:
+            # 와일드카드·정규식 특수문자가 없는 항목은 단순 이름 비교와 동일
+            literals = [p for p in key if "%" not in p and "_" not in p and re.escape(p) == p]
+            patterns = [p for p in key if p not in literals]
+            exclude_re = None
+            if patterns:
+                # SQL LIKE 패턴을 정규표현식으로 변환
+                alternation = "|".join(
+                    "(?:" + p.replace("%", ".*").replace("_", ".") + ")" for p in patterns
+                )
+                exclude_re = re.compile("^(?:" + alternation + ")$", re.IGNORECASE)
+            cached = (key, frozenset(p.upper() for p in literals), exclude_re)
+            self._exclude_cache = cached
+        return cached[1], cached[2]
+
+    def _table_filter_clauses(self, column: str, bind) -> tuple:
+        """
+        include/exclude 옵션을 WHERE 조건으로 변환합니다 (대소문자 무시).
+        exclude 항목은 SQL LIKE 패턴(%, _) 그대로 사용합니다.
+
+        Parameters:
+            column: 테이블명 컬럼 (table_name / view_name)
+            bind:   바인드 순번 → 자리표시자 문자열 (예: lambda i: f":f{i}")
+
+        Returns:
+            (조건 문자열 리스트, 바인드 값 리스트)
+        """
+        clauses: List[str] = []
+        params: List[str] = []
+        if self.include_tables:
+            # Oracle은 IN 목록 하나에 최대 1000개 (ORA-01795) → 1000개씩 나눠 OR로 연결
+            groups = []
+            for start in range(0, len(self.include_tables), IN_LIST_MAX):
+                marks = []
+                for t in self.include_tables[start:start + IN_LIST_MAX]:
+                    marks.append(bind(len(params)))
+                    params.append(t.upper())
+                groups.append(f"UPPER({column}) IN ({', '.join(marks)})")
+            clauses.append(groups[0] if len(groups) == 1 else f"({' OR '.join(groups)})")
+        for pattern in self.exclude_tables:
+            clauses.append(f"UPPER({column}) NOT LIKE {bind(len(params))}")
+            params.append(pattern.upper())
+        return clauses, params
+
     def build_joins_from_fk(self, tables: Dict[str, Any]) -> List[Dict[str, str]]:
         """외래키 정보를 기반으로 조인 규칙을 생성합니다."""
         joins = []
         seen = set()  # 중복 방지
+        seen_add = seen.add
+        joins_append = joins.append
 
         for table_name, info in tables.items():
             for fk in info.get("fk", []):
                 left = f"{table_name}.{fk['col']}"
                 right = f"{fk['ref_table']}.{fk['ref_col']}"
 
-                # 중복 체크 (양방향)
-                key = tuple(sorted([left, right]))
+                # 중복 체크 (양방향) — sorted() 리스트 생성 없이 두 값만 비교
+                key = (left, right) if left < right else (right, left)
                 if key not in seen:
-                    joins.append({"left": left, "right": right})
-                    seen.add(key)
+                    joins_append({"left": left, "right": right})
+                    seen_add(key)
 
         return joins
 
+    def _fetch_table_details(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        테이블별 columns/pk/fk를 조회합니다.
+        기본 구현은 테이블마다 3회 조회하며, 구현체에서 일괄 조회로 override합니다.
+        """
+        return {
+            table_name: {
+                "columns": self.get_column_details(table_name),
+                "pk": self.get_primary_keys(table_name),
+                "fk": self.get_foreign_keys(table_name),
+            }
+            for table_name in table_names
+        }
+
+    def _stream(self, sql: str, params=None):
+        """
+        execute 후 커서를 그대로 순회하며 행을 내보냅니다 (fetchall로 전체 결과를 리스트로 만들지 않음).
+        제너레이터이므로 실제 execute는 첫 행을 요청하는 시점에 일어납니다.
+        """
+        self.cursor.execute(sql, params or ())
+        yield from self.cursor
+
+    @staticmethod
+    def _group_table_details(
+        table_names: List[str],
+        column_rows,
+        pk_rows,
+        fk_rows,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        스키마 전체를 한 번에 조회한 행들을 table_name 기준으로 묶습니다.
+        각 행의 첫 값은 table_name이며, table_names에 없는 테이블의 행은 버립니다.
+        행 목록은 순서대로 한 번씩만 소비하므로 같은 커서의 _stream() 제너레이터를 넘겨도 됩니다.
+
+            column_rows: (table_name, column_name, data_type, nullable: bool)
+            pk_rows:     (table_name, column_name)
+            fk_rows:     (table_name, fk_column, ref_table, ref_column)
+        """
+        wanted = set(table_names)
+        columns = defaultdict(list)
+        pks = defaultdict(list)
+        fks = defaultdict(list)
+
+        for tbl, name, dtype, nullable in column_rows:
+            if tbl in wanted:
+                columns[tbl].append({"name": name, "type": dtype, "nullable": nullable})
+        for tbl, col in pk_rows:
+            if tbl in wanted:
+                pks[tbl].append(col)
+        for tbl, col, ref_table, ref_col in fk_rows:
+            if tbl in wanted:
+                fks[tbl].append({"col": col, "ref_table": ref_table, "ref_col": ref_col})
+
+        return {
+            t: {"columns": columns.get(t, []), "pk": pks.get(t, []), "fk": fks.get(t, [])}
+            for t in table_names
+        }
+
     def fetch_schema(self) -> Dict[str, Any]:
         """
         스키마 전체를 조회하여 딕셔너리로 반환합니다.
@@ -177,20 +410,11 @@ class SchemaFetcher(ABC):
         try:
             # 1. 테이블 목록 조회
             table_names = self.get_tables()
-            table_names = self.filter_tables(table_names)
+            if not self.filters_in_sql:
+                table_names = self.filter_tables(table_names)
 
             # 2. 각 테이블의 상세 정보 조회
-            tables = {}
-            for table_name in table_names:
-                columns = self.get_column_details(table_name)
-                pk = self.get_primary_keys(table_name)
-                fk = self.get_foreign_keys(table_name)
-
-                tables[table_name] = {
-                    "columns": columns,
-                    "pk": pk,
-                    "fk": fk
-                }
+            tables = self._fetch_table_details(table_names)
 
             # 3. 조인 규칙 생성 (외래키 기반)
             joins = self.build_joins_from_fk(tables)
@@ -215,22 +439,31 @@ class OracleSchemaFetcher(SchemaFetcher):
     """Oracle DB용 스키마 조회 구현체"""
 
     def connect(self):
-        try:
-            import oracledb
-        except ImportError:
-            raise ImportError("oracledb 패키지가 설치되지 않았습니다. pip install oracledb")
+        oracledb = _import_driver("oracledb", "oracledb")
 
         conn_config = self.config["connection"]
 
         # DSN 구성: host:port/service_name
         dsn = f"{conn_config['host']}:{conn_config['port']}/{conn_config['database']}"
 
-        self.conn = oracledb.connect(
-            user=conn_config["user"],
-            password=conn_config["password"],
-            dsn=dsn
+        pool = _get_pool(
+            ("oracle", dsn, conn_config["user"], conn_config["password"]),
+            lambda: oracledb.create_pool(
+                user=conn_config["user"],
+                password=conn_config["password"],
+                dsn=dsn,
+                min=1,
+                max=_POOL_SIZE,
+                increment=1,
+                # 같은 SQL 텍스트 재실행 시 soft parse 없이 캐시된 커서 재사용
+                stmtcachesize=50,
+            ),
         )
+        # close()의 conn.close()는 연결을 끊지 않고 풀에 반환
+        self.conn = pool.acquire()
         self.cursor = self.conn.cursor()
+        # 커서 순회 시 한 번의 왕복으로 가져올 행 수 (기본 100)
+        self.cursor.arraysize = 1000
 
     def close(self):
         if self.cursor:
@@ -238,34 +471,30 @@ class OracleSchemaFetcher(SchemaFetcher):
         if self.conn:
             self.conn.close()
 
-    def get_tables(self) -> List[str]:
+    filters_in_sql = True
+
+    def _select_names(self, column: str, owner_view: str, user_view: str) -> List[str]:
+        """include/exclude 조건을 WHERE에 포함해 테이블(뷰) 이름 목록 조회"""
+        clauses, params = self._table_filter_clauses(column, lambda i: f":f{i}")
+        binds = {f"f{i}": v for i, v in enumerate(params)}
         if self.owner:
-            sql = """
-                SELECT table_name
-                FROM all_tables
-                WHERE owner = :owner
-                ORDER BY table_name
-            """
-            self.cursor.execute(sql, {"owner": self.owner.upper()})
+            clauses.insert(0, "owner = :owner")
+            binds["owner"] = self.owner.upper()
+            source = owner_view
         else:
-            sql = """
-                SELECT table_name
-                FROM user_tables
-                ORDER BY table_name
-            """
-            self.cursor.execute(sql)
+            source = user_view
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        self.cursor.execute(
+            f"SELECT {column} FROM {source}{where} ORDER BY {column}", binds
+        )
+        return [row[0] for row in self.cursor]
 
-        tables = [row[0] for row in self.cursor.fetchall()]
+    def get_tables(self) -> List[str]:
+        tables = self._select_names("table_name", "all_tables", "user_tables")
 
         # 뷰 포함 시
         if self.include_views:
-            if self.owner:
-                sql = "SELECT view_name FROM all_views WHERE owner = :owner ORDER BY view_name"
-                self.cursor.execute(sql, {"owner": self.owner.upper()})
-            else:
-                sql = "SELECT view_name FROM user_views ORDER BY view_name"
-                self.cursor.execute(sql)
-            tables.extend([row[0] for row in self.cursor.fetchall()])
+            tables.extend(self._select_names("view_name", "all_views", "user_views"))
 
         return tables
 
@@ -287,7 +516,7 @@ class OracleSchemaFetcher(SchemaFetcher):
             """
             self.cursor.execute(sql, {"table_name": table_name})
 
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_column_details(self, table_name: str) -> List[Dict[str, Any]]:
         if self.owner:
@@ -308,7 +537,7 @@ class OracleSchemaFetcher(SchemaFetcher):
             self.cursor.execute(sql, {"table_name": table_name})
         return [
             {"name": row[0], "type": row[1], "nullable": row[2] == "Y"}
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
     def get_primary_keys(self, table_name: str) -> List[str]:
@@ -335,7 +564,7 @@ class OracleSchemaFetcher(SchemaFetcher):
             """
             self.cursor.execute(sql, {"table_name": table_name})
 
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_foreign_keys(self, table_name: str) -> List[Dict[str, str]]:
         if self.owner:
@@ -377,9 +606,94 @@ class OracleSchemaFetcher(SchemaFetcher):
 
         return [
             {"col": row[0], "ref_table": row[1], "ref_col": row[2]}
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
+    def _fetch_table_details(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        owner(또는 현재 사용자)의 컬럼/PK/FK를 각 1회씩, 총 3회 조회로 수집.
+        include/exclude 옵션은 get_tables와 같은 WHERE 조건으로 걸어 필요한 테이블 행만 가져옴.
+        """
+        if not table_names:
+            return {}
+
+        clauses, params = self._table_filter_clauses("table_name", lambda i: f":f{i}")
+        col_filter = "".join(f" AND {c}" for c in clauses)
+        c_clauses, _ = self._table_filter_clauses("c.table_name", lambda i: f":f{i}")
+        c_filter = "".join(f" AND {c}" for c in c_clauses)
+        filter_binds = {f"f{i}": v for i, v in enumerate(params)}
+
+        if self.owner:
+            binds = {"owner": self.owner.upper(), **filter_binds}
+            col_sql = f"""
+                SELECT table_name, column_name, data_type, nullable
+                FROM all_tab_columns
+                WHERE owner = :owner{col_filter}
+                ORDER BY table_name, column_id
+            """
+            pk_sql = f"""
+                SELECT c.table_name, cc.column_name
+                FROM all_constraints c
+                JOIN all_cons_columns cc ON c.constraint_name = cc.constraint_name
+                                         AND c.owner = cc.owner
+                WHERE c.owner = :owner
+                  AND c.constraint_type = 'P'{c_filter}
+                ORDER BY c.table_name, cc.position
+            """
+            fk_sql = f"""
+                SELECT
+                    c.table_name,
+                    cc.column_name AS fk_column,
+                    rc.table_name AS ref_table,
+                    rcc.column_name AS ref_column
+                FROM all_constraints c
+                JOIN all_cons_columns cc ON c.constraint_name = cc.constraint_name
+                                         AND c.owner = cc.owner
+                JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name
+                                        AND c.r_owner = rc.owner
+                JOIN all_cons_columns rcc ON rc.constraint_name = rcc.constraint_name
+                                          AND rc.owner = rcc.owner
+                                          AND cc.position = rcc.position
+                WHERE c.owner = :owner
+                  AND c.constraint_type = 'R'{c_filter}
+                ORDER BY c.table_name, cc.position
+            """
+        else:
+            binds = filter_binds
+            col_where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+            col_sql = f"""
+                SELECT table_name, column_name, data_type, nullable
+                FROM user_tab_columns{col_where}
+                ORDER BY table_name, column_id
+            """
+            pk_sql = f"""
+                SELECT c.table_name, cc.column_name
+                FROM user_constraints c
+                JOIN user_cons_columns cc ON c.constraint_name = cc.constraint_name
+                WHERE c.constraint_type = 'P'{c_filter}
+                ORDER BY c.table_name, cc.position
+            """
+            fk_sql = f"""
+                SELECT
+                    c.table_name,
+                    cc.column_name AS fk_column,
+                    rc.table_name AS ref_table,
+                    rcc.column_name AS ref_column
+                FROM user_constraints c
+                JOIN user_cons_columns cc ON c.constraint_name = cc.constraint_name
+                JOIN user_constraints rc ON c.r_constraint_name = rc.constraint_name
+                JOIN user_cons_columns rcc ON rc.constraint_name = rcc.constraint_name
+                                           AND cc.position = rcc.position
+                WHERE c.constraint_type = 'R'{c_filter}
+                ORDER BY c.table_name, cc.position
+            """
+
+        column_rows = ((r[0], r[1], r[2], r[3] == "Y") for r in self._stream(col_sql, binds))
+        pk_rows = self._stream(pk_sql, binds)
+        fk_rows = self._stream(fk_sql, binds)
+
+        return self._group_table_details(table_names, column_rows, pk_rows, fk_rows)
+
 
 # =============================================================================
 # MariaDB 구현체
@@ -388,21 +702,30 @@ class MariaDBSchemaFetcher(SchemaFetcher):
     """MariaDB용 스키마 조회 구현체"""
 
     def connect(self):
-        try:
-            import mariadb
-        except ImportError:
-            raise ImportError("mariadb 패키지가 설치되지 않았습니다. pip install mariadb")
+        mariadb = _import_driver("mariadb", "mariadb")
 
         conn_config = self.config["connection"]
 
-        self.conn = mariadb.connect(
-            host=conn_config["host"],
-            port=conn_config["port"],
-            user=conn_config["user"],
-            password=conn_config["password"],
-            database=conn_config["database"]
+        key = (
+            "mariadb", conn_config["host"], conn_config["port"],
+            conn_config["user"], conn_config["password"], conn_config["database"],
         )
-        self.cursor = self.conn.cursor()
+        pool = _get_pool(
+            key,
+            lambda: mariadb.ConnectionPool(
+                pool_name=f"db_schema_{len(_POOLS)}",
+                pool_size=_POOL_SIZE,
+                host=conn_config["host"],
+                port=conn_config["port"],
+                user=conn_config["user"],
+                password=conn_config["password"],
+                database=conn_config["database"]
+            ),
+        )
+        # close()의 conn.close()는 연결을 끊지 않고 풀에 반환
+        self.conn = pool.get_connection()
+        # prepared 커서: 같은 SQL은 서버에서 한 번만 prepare 후 바인드 값만 바꿔 실행
+        self.cursor = self.conn.cursor(prepared=True)
 
         # 사용할 데이터베이스 (스키마)
         self.database = self.owner if self.owner else conn_config["database"]
@@ -413,28 +736,32 @@ class MariaDBSchemaFetcher(SchemaFetcher):
         if self.conn:
             self.conn.close()
 
+    filters_in_sql = True
+
     def get_tables(self) -> List[str]:
-        sql = """
+        clauses, params = self._table_filter_clauses("table_name", lambda i: "%s")
+        filt = "".join(f"\n              AND {c}" for c in clauses)
+        sql = f"""
             SELECT table_name
             FROM information_schema.tables
             WHERE table_schema = %s
-              AND table_type = 'BASE TABLE'
+              AND table_type = 'BASE TABLE'{filt}
             ORDER BY table_name
         """
-        self.cursor.execute(sql, (self.database,))
-        tables = [row[0] for row in self.cursor.fetchall()]
+        self.cursor.execute(sql, (self.database, *params))
+        tables = [row[0] for row in self.cursor]
 
         # 뷰 포함 시
         if self.include_views:
-            sql = """
+            sql = f"""
                 SELECT table_name
                 FROM information_schema.tables
                 WHERE table_schema = %s
-                  AND table_type = 'VIEW'
+                  AND table_type = 'VIEW'{filt}
                 ORDER BY table_name
             """
-            self.cursor.execute(sql, (self.database,))
-            tables.extend([row[0] for row in self.cursor.fetchall()])
+            self.cursor.execute(sql, (self.database, *params))
+            tables.extend([row[0] for row in self.cursor])
 
         return tables
 
@@ -446,7 +773,7 @@ class MariaDBSchemaFetcher(SchemaFetcher):
             ORDER BY ordinal_position
         """
         self.cursor.execute(sql, (self.database, table_name))
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_column_details(self, table_name: str) -> List[Dict[str, Any]]:
         sql = """
@@ -458,7 +785,7 @@ class MariaDBSchemaFetcher(SchemaFetcher):
         self.cursor.execute(sql, (self.database, table_name))
         return [
             {"name": row[0], "type": row[1], "nullable": row[2] == "YES"}
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
     def get_primary_keys(self, table_name: str) -> List[str]:
@@ -475,7 +802,7 @@ class MariaDBSchemaFetcher(SchemaFetcher):
             ORDER BY kcu.ordinal_position
         """
         self.cursor.execute(sql, (self.database, table_name))
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_foreign_keys(self, table_name: str) -> List[Dict[str, str]]:
         sql = """
@@ -492,9 +819,57 @@ class MariaDBSchemaFetcher(SchemaFetcher):
         self.cursor.execute(sql, (self.database, table_name))
         return [
             {"col": row[0], "ref_table": row[1], "ref_col": row[2]}
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
+    def _fetch_table_details(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        table_schema의 컬럼/PK/FK를 각 1회씩, 총 3회 조회로 수집.
+        include/exclude 옵션은 get_tables와 같은 WHERE 조건으로 걸어 필요한 테이블 행만 가져옴.
+        """
+        if not table_names:
+            return {}
+
+        clauses, params = self._table_filter_clauses("table_name", lambda i: "%s")
+        col_filter = "".join(f" AND {c}" for c in clauses)
+        kcu_clauses, _ = self._table_filter_clauses("kcu.table_name", lambda i: "%s")
+        kcu_filter = "".join(f" AND {c}" for c in kcu_clauses)
+        binds = (self.database, *params)
+
+        column_rows = self._stream(f"""
+            SELECT table_name, column_name, column_type, is_nullable
+            FROM information_schema.columns
+            WHERE table_schema = %s{col_filter}
+            ORDER BY table_name, ordinal_position
+        """, binds)
+        column_rows = ((r[0], r[1], r[2], r[3] == "YES") for r in column_rows)
+
+        pk_rows = self._stream(f"""
+            SELECT kcu.table_name, kcu.column_name
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+                AND tc.table_name = kcu.table_name
+            WHERE tc.table_schema = %s
+              AND tc.constraint_type = 'PRIMARY KEY'{kcu_filter}
+            ORDER BY kcu.table_name, kcu.ordinal_position
+        """, binds)
+
+        fk_rows = self._stream(f"""
+            SELECT
+                kcu.table_name,
+                kcu.column_name AS fk_column,
+                kcu.referenced_table_name AS ref_table,
+                kcu.referenced_column_name AS ref_column
+            FROM information_schema.key_column_usage kcu
+            WHERE kcu.table_schema = %s
+              AND kcu.referenced_table_name IS NOT NULL{kcu_filter}
+            ORDER BY kcu.table_name, kcu.ordinal_position
+        """, binds)
+
+        return self._group_table_details(table_names, column_rows, pk_rows, fk_rows)
+
 
 # =============================================================================
 # PostgreSQL 구현체
@@ -545,20 +920,23 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
         self._active_schemas: List[str] = []   # connect() 후 결정
         self._use_prefix: bool = True           # 테이블 키에 "schema." 접두어 여부
 
-    def connect(self):
-        try:
-            import psycopg2
-        except ImportError:
-            raise ImportError("psycopg2 패키지가 설치되지 않았습니다. pip install psycopg2-binary")
+    # 테이블별 상세 조회를 동시에 보낼 최대 작업자 수 (작업자마다 별도 연결 1개)
+    DETAIL_WORKERS = 8
+
+    def _open_connection(self):
+        psycopg2 = _import_driver("psycopg2", "psycopg2-binary")
 
         conn_config = self.config["connection"]
-        self.conn = psycopg2.connect(
+        return psycopg2.connect(
             host=conn_config["host"],
             port=int(conn_config.get("port", 5432)),
             user=conn_config["user"],
             password=conn_config["password"],
             dbname=conn_config["database"],
         )
+
+    def connect(self):
+        self.conn = self._open_connection()
         self.cursor = self.conn.cursor()
 
         # ── LIKE 패턴 / exact match / 자동 감지로 _active_schemas 결정 ──
@@ -572,7 +950,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
                     (pat,),
                 )
                 resolved.update(
-                    row[0] for row in self.cursor.fetchall()
+                    row[0] for row in self.cursor
                     if row[0] not in self._SYSTEM_SCHEMAS
                     and not row[0].startswith("pg_")
                 )
@@ -590,7 +968,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
                   AND schema_name NOT LIKE 'pg_%%'
                 ORDER BY schema_name
             """)
-            self._active_schemas = [row[0] for row in self.cursor.fetchall()]
+            self._active_schemas = [row[0] for row in self.cursor]
             self._use_prefix = True   # 자동 감지는 항상 prefix 사용
 
     def close(self):
@@ -626,7 +1004,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
             ORDER BY table_schema, table_name
         """
         self.cursor.execute(sql, self._active_schemas)
-        return [self._make_table_key(row[0], row[1]) for row in self.cursor.fetchall()]
+        return [self._make_table_key(row[0], row[1]) for row in self.cursor]
 
     def get_columns(self, table_name: str) -> List[str]:
         schema, tbl = self._split_table_key(table_name)
@@ -636,7 +1014,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
             WHERE table_schema = %s AND table_name = %s
             ORDER BY ordinal_position
         """, (schema, tbl))
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_column_details(self, table_name: str) -> List[Dict[str, Any]]:
         schema, tbl = self._split_table_key(table_name)
@@ -656,7 +1034,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
         """, (schema, tbl))
         return [
             {"name": row[0], "type": row[1], "nullable": bool(row[2])}
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
     def get_primary_keys(self, table_name: str) -> List[str]:
@@ -673,7 +1051,7 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
               AND tc.constraint_type = 'PRIMARY KEY'
             ORDER BY kcu.ordinal_position
         """, (schema, tbl))
-        return [row[0] for row in self.cursor.fetchall()]
+        return [row[0] for row in self.cursor]
 
     def get_foreign_keys(self, table_name: str) -> List[Dict[str, str]]:
         schema, tbl = self._split_table_key(table_name)
@@ -705,9 +1083,53 @@ class PostgreSQLSchemaFetcher(SchemaFetcher):
                 "ref_table": self._make_table_key(row[1], row[2]),
                 "ref_col": row[3],
             }
-            for row in self.cursor.fetchall()
+            for row in self.cursor
         ]
 
+    def _fetch_table_details(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        PostgreSQL은 테이블마다 3회 조회하므로, 테이블을 작업자별 연결에 나눠 동시에 조회합니다.
+        (드라이버가 조회 대기 중 GIL을 놓으므로 네트워크 왕복이 겹쳐짐)
+        작업자 수는 schema_options.detail_workers로 조정하며, 결과는 table_names 순서를 유지합니다.
+        """
+        workers = min(int(self.schema_options.get("detail_workers", self.DETAIL_WORKERS)), len(table_names))
+        if workers <= 1:
+            return super()._fetch_table_details(table_names)
+
+        local = threading.local()
+        opened: List["PostgreSQLSchemaFetcher"] = []
+        opened_lock = threading.Lock()
+
+        def _details(table_name: str):
+            worker = getattr(local, "worker", None)
+            if worker is None:
+                # 스키마 해석 결과(_active_schemas 등)는 공유하고 연결/커서만 작업자 전용으로 연다
+                worker = copy.copy(self)
+                worker.conn = None
+                worker.cursor = None
+                with opened_lock:
+                    opened.append(worker)
+                worker.conn = self._open_connection()
+                worker.cursor = worker.conn.cursor()
+                local.worker = worker
+            return table_name, {
+                "columns": worker.get_column_details(table_name),
+                "pk": worker.get_primary_keys(table_name),
+                "fk": worker.get_foreign_keys(table_name),
+            }
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            return dict(executor.map(_details, table_names))
+        except BaseException:
+            # 한 테이블이라도 실패하면 대기 중인 테이블 조회는 보내지 않고 바로 오류 전달
+            executor.shutdown(cancel_futures=True)
+            raise
+        finally:
+            executor.shutdown()
+            for worker in opened:
+                worker.close()
+
 
 # =============================================================================
 # 팩토리 함수
@@ -754,6 +1176,62 @@ def _make_options_fingerprint(config: Dict[str, Any]) -> str:
     return hashlib.md5(raw.encode()).hexdigest()
 
 
+def _read_cache_entry(
+    cache_file: str,
+    config: Optional[Dict[str, Any]] = None,
+) -> Optional[tuple]:
+    """
+    캐시 파일을 읽어 (스키마, 경과 시간(초))을 반환합니다. TTL 판단은 호출부에서 합니다.
+    파일이 없거나 손상되었거나 schema_options가 변경되었으면 None을 반환합니다.
+    """
+    cached = _read_cache_file(cache_file)
+    if cached is None:
+        return None
+
+    # schema_options 변경 검사
+    if config is not None:
+        current_fp = _make_options_fingerprint(config)
+        cached_fp = cached.get("_options_fingerprint", "")
+        if current_fp != cached_fp:
+            print("[INFO] schema_options가 변경되어 캐시를 무시합니다.")
+            return None
+
+    # 내용이 같아 재기록을 생략한 경우 _cached_at 대신 파일 mtime만 갱신됨
+    try:
+        cached_at = max(cached.get("_cached_at", 0), os.path.getmtime(cache_file))
+    except OSError:
+        cached_at = cached.get("_cached_at", 0)
+    age = time.time() - cached_at
+
+    # 메타데이터 제거 후 반환
+    schema = {k: v for k, v in cached.items() if not k.startswith("_")}
+    return schema, age
+
+
+def _read_cache_file(cache_file: str) -> Optional[Dict[str, Any]]:
+    """캐시 파일 원본(메타데이터 포함)을 읽습니다. 없거나 손상되었으면 None."""
+    if not os.path.exists(cache_file):
+        return None
+
+    try:
+        with open(cache_file, "rb") as f:
+            raw = f.read()
+        # 큰 스키마는 gzip으로 저장됨 → 매직 바이트로 판별
+        if raw[:2] == _GZIP_MAGIC:
+            raw = gzip.decompress(raw)
+        cached = _loads_json(raw)
+        return cached if isinstance(cached, dict) else None
+
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError, EOFError, zlib.error):
+        return None
+
+
+def _make_schema_hash(schema: Dict[str, Any]) -> str:
+    """스키마 내용(키 정렬 직렬화)의 해시 — 캐시 재기록 필요 여부 판단용"""
+    import hashlib
+    return hashlib.blake2b(_dumps_json(schema, sort_keys=True), digest_size=16).hexdigest()
+
+
 def load_cached_schema(
     cache_file: str,
     ttl: int = 3600,
@@ -771,32 +1249,14 @@ def load_cached_schema(
     Returns:
         스키마 딕셔너리 또는 None
     """
-    if not os.path.exists(cache_file):
+    entry = _read_cache_entry(cache_file, config=config)
+    if entry is None:
         return None
-
-    try:
-        with open(cache_file, "r", encoding="utf-8") as f:
-            cached = json.load(f)
-
-        # TTL 만료 검사
-        cached_time = cached.get("_cached_at", 0)
-        if time.time() - cached_time > ttl:
-            return None
-
-        # schema_options 변경 검사
-        if config is not None:
-            current_fp = _make_options_fingerprint(config)
-            cached_fp = cached.get("_options_fingerprint", "")
-            if current_fp != cached_fp:
-                print("[INFO] schema_options가 변경되어 캐시를 무시합니다.")
-                return None
-
-        # 메타데이터 제거 후 반환
-        schema = {k: v for k, v in cached.items() if not k.startswith("_")}
-        return schema
-
-    except (json.JSONDecodeError, KeyError):
+    schema, age = entry
+    # TTL 만료 검사
+    if age > ttl:
         return None
+    return schema
 
 
 def save_schema_to_cache(
@@ -812,14 +1272,49 @@ def save_schema_to_cache(
         cache_file: 캐시 파일 경로
         config: 현재 설정 딕셔너리 (핑거프린트 저장용)
     """
-    cached = schema.copy()
-    cached["_cached_at"] = time.time()
-    cached["_db_type"] = schema.get("_db_type", "unknown")
-    if config is not None:
-        cached["_options_fingerprint"] = _make_options_fingerprint(config)
-
-    with open(cache_file, "w", encoding="utf-8") as f:
-        json.dump(cached, f, ensure_ascii=False, indent=2)
+    schema_hash = _make_schema_hash(schema)
+    options_fp = _make_options_fingerprint(config) if config is not None else None
+
+    # 기존 캐시와 내용·옵션이 같으면 다시 쓰지 않고 mtime만 갱신 (TTL 연장)
+    existing = _read_cache_file(cache_file)
+    if (
+        existing is not None
+        and existing.get("_schema_hash") == schema_hash
+        and existing.get("_options_fingerprint") == options_fp
+    ):
+        try:
+            os.utime(cache_file, None)
+            return
+        except OSError:
+            pass
+
+    # 메타데이터 헤더 + 스키마 본문을 한 번에 구성 (호출자 dict는 복사·수정하지 않음)
+    header = {
+        "_cached_at": time.time(),
+        "_db_type": schema.get("_db_type", "unknown"),
+        "_schema_hash": schema_hash,
+    }
+    if options_fp is not None:
+        header["_options_fingerprint"] = options_fp
+    data = _dumps_json({**header, **{k: v for k, v in schema.items() if not k.startswith("_")}})
+    if len(data) > CACHE_GZIP_THRESHOLD:
+        data = gzip.compress(data, compresslevel=6)
+
+    # 임시 파일에 쓴 뒤 교체 → 중간에 중단돼도 기존 캐시가 깨지지 않음
+    # (백그라운드 갱신·다른 프로세스와 겹쳐도 임시 파일이 섞이지 않도록 pid/스레드별 이름 사용)
+    tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
 
 
 # =============================================================================
@@ -832,6 +1327,8 @@ def get_schema(
     """
     스키마를 반환합니다.
     캐싱이 활성화되어 있으면 캐시를 우선 사용합니다.
+    TTL이 지났어도 cache.stale_ttl_seconds(기본 TTL×2) 이내면 기존 캐시를 바로 반환하고
+    백그라운드 스레드에서 DB 재조회 후 캐시를 갱신합니다.
 
     Parameters:
         config_path: 설정 파일 경로
@@ -849,16 +1346,33 @@ def get_schema(
     config = load_config(config_path)
     cache_enabled = config.get("cache", {}).get("enabled", True)
     cache_ttl = config.get("cache", {}).get("ttl_seconds", 3600)
+    stale_ttl = config.get("cache", {}).get("stale_ttl_seconds", cache_ttl * 2)
     cache_file = get_cache_path(config_path)
 
     # 캐시 확인 (schema_options 변경 시 자동 무효화)
     if cache_enabled and not force_refresh:
-        cached = load_cached_schema(cache_file, cache_ttl, config=config)
-        if cached:
-            print(f"[INFO] 캐시에서 스키마 로드됨 ({cache_file})")
-            return cached
-
-    # DB에서 조회
+        entry = _read_cache_entry(cache_file, config=config)
+        if entry is not None:
+            cached, age = entry
+            if age <= cache_ttl:
+                print(f"[INFO] 캐시에서 스키마 로드됨 ({cache_file})")
+                return cached
+            # stale-while-revalidate: TTL은 지났지만 stale_ttl 이내면
+            # 기존 캐시를 즉시 반환하고 백그라운드에서 갱신
+            if age <= stale_ttl:
+                print(f"[INFO] 만료된 캐시를 반환하고 백그라운드에서 갱신합니다 ({cache_file})")
+                _start_background_refresh(config, cache_file)
+                return cached
+
+    return _fetch_and_cache(config, cache_file, cache_enabled)
+
+
+def _fetch_and_cache(
+    config: Dict[str, Any],
+    cache_file: str,
+    cache_enabled: bool = True,
+) -> Dict[str, Any]:
+    """DB에서 스키마를 조회하고 (캐시 활성 시) 캐시 파일에 저장합니다."""
     db_type = config.get("db_type", "oracle")
     print(f"[INFO] {db_type.upper()} DB에서 스키마 조회 중...")
 
@@ -876,6 +1390,30 @@ def get_schema(
     return schema
 
 
+# 백그라운드 갱신 중인 캐시 파일 (같은 캐시를 동시에 여러 번 갱신하지 않도록)
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+
+
+def _start_background_refresh(config: Dict[str, Any], cache_file: str) -> None:
+    """캐시 갱신 스레드를 시작합니다. 이미 갱신 중이면 아무것도 하지 않습니다."""
+    with _refreshing_lock:
+        if cache_file in _refreshing:
+            return
+        _refreshing.add(cache_file)
+
+    def _refresh():
+        try:
+            _fetch_and_cache(config, cache_file)
+        except Exception as e:
+            print(f"[WARN] 백그라운드 스키마 갱신 실패: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(cache_file)
+
+    threading.Thread(target=_refresh, name="schema-cache-refresh", daemon=True).start()
+
+
 def get_db_type(config_path: str = CONFIG_FILE) -> str:
     """
     설정 파일에서 DB 타입을 반환합니다.
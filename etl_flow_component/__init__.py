@@ -6,6 +6,8 @@ React Flow 기반 인터랙티브 ETL 파이프라인 시각화
 import os
 import subprocess
 import sys
+from functools import lru_cache
+
 import streamlit.components.v1 as components
 
 _COMPONENT_NAME = "etl_flow_map"
@@ -110,6 +112,54 @@ def etl_flow_map(
     )
 
 
+# 스키마 접두사 → 레이어 매핑
+_SCHEMA_LAYER: dict[str, str] = {
+    "ODS": "ods", "STG": "ods", "STAGING": "ods", "RAW": "ods",
+    "SOURCE": "ods", "SRC": "ods",
+    "DM": "dm", "MART": "dm", "MARTS": "dm",
+    "ANALYTICS": "dm", "REPORT": "dm", "BI": "dm",
+}
+
+# 테이블명 접두사 → 레이어 (위에서부터 순서대로 검사)
+_LAYER_PREFIXES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("ods",  ("ODS_", "STG_")),
+    ("fact", ("FACT_", "DW_FACT")),
+    ("dim",  ("DIM_", "DW_DIM")),
+    ("dm",   ("DM_", "MART_")),
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_layer(table_name: str) -> str:
+    name = table_name.upper()
+
+    # 스키마 포함 이름 처리 (예: "dw.dim_employee", "src.employee")
+    if "." in name:
+        schema, _, table = name.partition(".")
+        if schema in _SCHEMA_LAYER:
+            return _SCHEMA_LAYER[schema]
+        # DW 스키마는 테이블명으로 세분화
+        name = table
+
+    for layer, prefixes in _LAYER_PREFIXES:
+        if name.startswith(prefixes):
+            return layer
+    return "custom"
+
+
+def _normalize_column(c: dict) -> dict:
+    """
+    컬럼 메타(name/type/pk 또는 column_name/data_type/is_pk)를 Flow Map 형식으로 정규화합니다.
+    대체 키는 기본 키가 없을 때만 조회합니다.
+    """
+    return {
+        "name":     c["name"] if "name" in c else c.get("column_name", ""),
+        "type":     c["type"] if "type" in c else c.get("data_type", ""),
+        "pk":       bool(c["pk"] if "pk" in c else c.get("is_pk", False)),
+        "nullable": bool(c.get("nullable", True)),
+    }
+
+
 def build_flow_data_from_mappings(mappings: list[dict]) -> tuple[list[dict], list[dict]]:
     """
     AETL 매핑 결과 목록에서 Flow Map용 nodes/edges를 생성합니다.
@@ -126,35 +176,7 @@ def build_flow_data_from_mappings(mappings: list[dict]) -> tuple[list[dict], lis
     """
     node_map: dict[str, dict] = {}
     edges: list[dict] = []
-
-    # 스키마 접두사 → 레이어 매핑
-    _SCHEMA_LAYER: dict[str, str] = {
-        "ODS": "ods", "STG": "ods", "STAGING": "ods", "RAW": "ods",
-        "SOURCE": "ods", "SRC": "ods",
-        "DM": "dm", "MART": "dm", "MARTS": "dm",
-        "ANALYTICS": "dm", "REPORT": "dm", "BI": "dm",
-    }
-
-    def _infer_layer(table_name: str) -> str:
-        name = table_name.upper()
-
-        # 스키마 포함 이름 처리 (예: "dw.dim_employee", "src.employee")
-        if "." in name:
-            schema, _, table = name.partition(".")
-            if schema in _SCHEMA_LAYER:
-                return _SCHEMA_LAYER[schema]
-            # DW 스키마는 테이블명으로 세분화
-            name = table
-
-        if name.startswith(("ODS_", "STG_")):
-            return "ods"
-        if name.startswith(("FACT_", "DW_FACT")):
-            return "fact"
-        if name.startswith(("DIM_", "DW_DIM")):
-            return "dim"
-        if name.startswith(("DM_", "MART_")):
-            return "dm"
-        return "custom"
+    seen_edges: set[tuple[str, str, str]] = set()
 
     for m in mappings:
         src = m.get("source_meta", {})
@@ -169,26 +191,24 @@ def build_flow_data_from_mappings(mappings: list[dict]) -> tuple[list[dict], lis
                 "id":       tid,
                 "label":    tid,
                 "layer":    _infer_layer(tid),
-                "columns":  [
-                    {
-                        "name":     c.get("name", c.get("column_name", "")),
-                        "type":     c.get("type", c.get("data_type", "")),
-                        "pk":       bool(c.get("pk", c.get("is_pk", False))),
-                        "nullable": bool(c.get("nullable", True)),
-                    }
-                    for c in cols
-                ],
+                "columns":  [_normalize_column(c) for c in cols],
                 "col_count": len(cols),
             }
 
         src_id = src.get("table_name", "")
         tgt_id = tgt.get("table_name", "")
         if src_id and tgt_id:
+            label = m.get("load_type", "MERGE")
+            # 같은 (source, target, 적재유형) 매핑이 반복되면 엣지 하나로 합침
+            edge_key = (src_id, tgt_id, label)
+            if edge_key in seen_edges:
+                continue
+            seen_edges.add(edge_key)
             edges.append({
-                "id":     f"e_{src_id}_{tgt_id}",
+                "id":     f"e_{src_id}_{tgt_id}_{label}",  # 적재유형별 엣지가 따로 남으므로 id에도 포함
                 "source": src_id,
                 "target": tgt_id,
-                "label":  m.get("load_type", "MERGE"),
+                "label":  label,
             })
 
     return list(node_map.values()), edges
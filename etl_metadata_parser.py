@@ -15,12 +15,29 @@ Excel/CSV 테이블 정의서를 파싱하여 구조화된 메타데이터를 
   설명:     description, 설명, comment, COMMENT, remarks
 """
 
+import hashlib
 import io
-import re
+import os
+import pickle
+import threading
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 
+# pandas는 2.2부터 engine="calamine"을 지원 → 그 이전 버전이거나 미설치 시 기본 엔진(openpyxl/xlrd) 사용
+_EXCEL_ENGINE: Optional[str] = None
+if tuple(int(p) for p in pd.__version__.split(".")[:2] if p.isdigit()) >= (2, 2):
+    try:
+        import python_calamine  # noqa: F401  (pandas read_excel engine="calamine")
+        _EXCEL_ENGINE = "calamine"
+    except ImportError:
+        pass
+
 
 # ─────────────────────────────────────────
 # 컬럼명 후보 매핑
@@ -34,7 +51,16 @@ _COL_ALIASES = {
     "description":  ["description", "설명", "comment", "remarks", "비고", "desc", "컬럼설명"],
 }
 
-# 소스/타겟 시트 이름 후보
+# 매핑 정의서 컬럼명 후보
+_MAPPING_ALIASES = {
+    "source_table":  ["source_table", "소스테이블", "src_table", "원천테이블", "source table"],
+    "source_col":    ["source_column", "source_col", "소스컬럼", "src_col", "원천컬럼", "source column"],
+    "target_table":  ["target_table", "타겟테이블", "tgt_table", "dest_table", "target table"],
+    "target_col":    ["target_column", "target_col", "타겟컬럼", "tgt_col", "target column"],
+    "transform":     ["transform", "변환규칙", "변환", "rule", "비고", "remarks"],
+}
+
+# 소스/타겟 시트 이름 후보 (소문자로 유지 — _find_sheet가 그대로 조회)
 _SOURCE_SHEET_NAMES = ["source", "소스", "src", "원천", "ods", "sheet1", "source_table"]
 _TARGET_SHEET_NAMES = ["target", "타겟", "tgt", "dw", "dwh", "dest", "sheet2", "target_table"]
 
@@ -42,26 +68,61 @@ _TARGET_SHEET_NAMES = ["target", "타겟", "tgt", "dw", "dwh", "dest", "sheet2",
 _MAPPING_SHEET_NAMES = ["mapping", "매핑", "column_mapping", "컬럼매핑", "map", "sheet3"]
 
 
+_NORM_TABLE = str.maketrans("", "", " _")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str) -> str:
+    return text.strip().lower().translate(_NORM_TABLE)
+
+
 def _normalize(text: str) -> str:
-    """소문자 + 공백 제거"""
-    return str(text).strip().lower().replace(" ", "").replace("_", "")
+    """소문자 + 공백 제거 (같은 헤더 문자열이 필드 수만큼 반복 조회되므로 결과 캐시)"""
+    return _normalize_cached(text if type(text) is str else str(text))
+
+
+# 후보 목록을 정규화된 frozenset으로 미리 변환 (import 시 1회)
+_COL_ALIASES_NORM = {
+    field: frozenset(_normalize(a) for a in aliases) for field, aliases in _COL_ALIASES.items()
+}
+_MAPPING_ALIASES_NORM = {
+    field: frozenset(_normalize(a) for a in aliases) for field, aliases in _MAPPING_ALIASES.items()
+}
 
 
-def _detect_column(df_columns: list[str], field: str) -> Optional[str]:
+def _detect_column(df_columns: list[str], field: str, aliases_norm: dict = _COL_ALIASES_NORM) -> Optional[str]:
     """df 컬럼 중 field 후보와 일치하는 것을 반환"""
-    aliases = [_normalize(a) for a in _COL_ALIASES.get(field, [])]
-    for col in df_columns:
-        if _normalize(col) in aliases:
-            return col
-    return None
+    aliases = aliases_norm.get(field, frozenset())
+    return next((col for col in df_columns if _normalize(col) in aliases), None)
+
+
+# Y/N 플래그 판정용 값 (대문자 기준)
+_YES_VALUES = ("Y", "YES", "TRUE", "1", "O", "●", "○", "V", "✓", "✔")
+_NOT_NULL_VALUES = ("N", "NO", "NOT NULL", "NN", "FALSE", "0")
+# 매핑정의서 N.N 열: "Y"도 NOT NULL 표시로 쓰임
+_MAPPING_NN_VALUES = frozenset(("NN", "N", "NOT NULL", "Y"))
+
+
+# 흔한 소문자 표기도 포함해 대부분의 값은 upper() 없이 바로 판정
+_YES_SET = frozenset(_YES_VALUES) | frozenset(v.lower() for v in _YES_VALUES)
+
+
+def _is_na(value) -> bool:
+    """object 배열 원소의 결측 판정 (None/NaN/pd.NA/NaT만 다루므로 pd.isna 디스패치 생략)"""
+    return (
+        value is None or value is pd.NA or value is pd.NaT
+        or (isinstance(value, float) and value != value)
+    )
 
 
 def _is_yes(value) -> bool:
     """PK/Not-Null 등 Y/N 값을 bool로 변환"""
-    if pd.isna(value):
+    if type(value) is str:  # 가장 흔한 경우: pd.isna 디스패치 생략
+        s = value.strip()
+        return s in _YES_SET or s.upper() in _YES_SET
+    if _is_na(value):
         return False
-    s = str(value).strip().upper()
-    return s in ("Y", "YES", "TRUE", "1", "O", "●", "○", "V", "✓", "✔")
+    return str(value).strip().upper() in _YES_SET
 
 
 def _parse_dataframe(df: pd.DataFrame, default_table_name: str = "UNKNOWN") -> dict:
@@ -91,52 +152,53 @@ def _parse_dataframe(df: pd.DataFrame, default_table_name: str = "UNKNOWN") -> d
         # 컬럼명 컬럼을 찾지 못하면 첫 번째 컬럼을 사용
         col_col = cols[0]
 
-    columns = []
-    seen_table = default_table_name
-
-    for _, row in df.iterrows():
-        if table_col and not pd.isna(row.get(table_col)):
-            val = str(row[table_col]).strip()
-            if val:
-                seen_table = val.upper()
-
-        col_name_val = row.get(col_col)
-        if pd.isna(col_name_val) or str(col_name_val).strip() == "":
-            continue
-        col_name = str(col_name_val).strip().upper()
-
-        dtype = ""
-        if col_map["data_type"] and not pd.isna(row.get(col_map["data_type"])):
-            dtype = str(row[col_map["data_type"]]).strip()
-
-        is_pk = False
-        if col_map["pk"] and not pd.isna(row.get(col_map["pk"])):
-            is_pk = _is_yes(row[col_map["pk"]])
-
-        # nullable: "Y" = NULL 허용 = nullable=True / "N" = NOT NULL = nullable=False
-        nullable = True
-        if col_map["nullable"] and not pd.isna(row.get(col_map["nullable"])):
-            raw = str(row[col_map["nullable"]]).strip().upper()
-            # "NOT NULL" 계열이면 nullable=False
-            if raw in ("N", "NO", "NOT NULL", "NN", "FALSE", "0"):
-                nullable = False
-            else:
-                nullable = True
-
-        desc = ""
-        if col_map["description"] and not pd.isna(row.get(col_map["description"])):
-            desc = str(row[col_map["description"]]).strip()
-
-        columns.append({
-            "name":        col_name,
+    # 감지된 컬럼별로 "NaN → 빈 문자열, 나머지는 str().strip()"을 Series 연산으로 한 번에 정규화
+    def _text(col) -> Optional[pd.Series]:
+        if not col:
+            return None
+        s = df[col]
+        return s.astype(str).str.strip().where(s.notna(), "")
+
+    def _const(value) -> pd.Series:
+        return pd.Series(value, index=df.index, dtype=object)
+
+    names    = _text(col_col).str.upper()
+    types    = _text(col_map["data_type"])
+    descs    = _text(col_map["description"])
+    pk_raw   = _text(col_map["pk"])
+    null_raw = _text(col_map["nullable"])
+
+    pks = pk_raw.str.upper().isin(_YES_VALUES) if pk_raw is not None else _const(False)
+    # nullable: "Y" = NULL 허용 = nullable=True / "N" = NOT NULL = nullable=False
+    nullables = ~null_raw.str.upper().isin(_NOT_NULL_VALUES) if null_raw is not None else _const(True)
+    if types is None:
+        types = _const("")
+    if descs is None:
+        descs = _const("")
+
+    valid = (names != "").to_numpy()
+    columns = [
+        {
+            "name":        name,
             "type":        dtype,
-            "pk":          is_pk,
-            "nullable":    nullable,
+            "pk":          bool(is_pk),
+            "nullable":    bool(nullable),
             "description": desc,
-        })
+        }
+        for name, dtype, is_pk, nullable, desc in zip(
+            names[valid], types[valid], pks[valid], nullables[valid], descs[valid]
+        )
+    ]
 
-    table_name = seen_table if table_col else default_table_name
-    pk_columns = [c["name"] for c in columns if c["pk"]]
+    # 테이블명: 값이 있는 마지막 행 기준 (ffill 후 마지막 값과 동일하므로 필터 한 번으로 계산)
+    table_name = default_table_name
+    if table_col:
+        tables = _text(table_col)
+        tables = tables[tables != ""]
+        if len(tables):
+            table_name = tables.iloc[-1]
+
+    pk_columns = names[valid & pks.to_numpy(dtype=bool)].tolist()
 
     return {
         "table_name": table_name.upper(),
@@ -145,19 +207,203 @@ def _parse_dataframe(df: pd.DataFrame, default_table_name: str = "UNKNOWN") -> d
     }
 
 
-def _find_sheet(xl: pd.ExcelFile, candidates: list[str]) -> Optional[str]:
-    """시트 이름 후보 중 일치하는 것 반환"""
-    sheet_names_lower = {s.lower(): s for s in xl.sheet_names}
+def _sheet_map(xl: pd.ExcelFile) -> dict[str, str]:
+    """소문자 시트명 → 원래 시트명"""
+    return {s.lower(): s for s in xl.sheet_names}
+
+
+def _find_sheet(sheet_map: dict[str, str], candidates: list[str]) -> Optional[str]:
+    """시트 이름 후보(소문자, 우선순위 순) 중 일치하는 것 반환"""
     for c in candidates:
-        if c.lower() in sheet_names_lower:
-            return sheet_names_lower[c.lower()]
+        found = sheet_map.get(c)
+        if found:
+            return found
     return None
 
 
+# ─────────────────────────────────────────
+# 파싱 결과 캐시 (파일 내용 기준)
+# ─────────────────────────────────────────
+# Streamlit 재실행마다 같은 정의서를 다시 파싱하지 않도록 결과를 pickle로 보관
+_RESULT_CACHE_DIR = Path(__file__).parent / ".metadata_cache"
+_RESULT_CACHE_MAX_AGE = 7 * 24 * 3600       # 마지막 사용 후 7일 지난 항목 삭제
+_RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 전체 크기 상한 (초과 시 오래 안 쓴 것부터 삭제)
+_MEM_CACHE_SIZE = 32
+_mem_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_mem_cache_lock = threading.Lock()
+
+
+def _source_fingerprint() -> Optional[str]:
+    """이 모듈 소스의 해시 — 파서 코드가 바뀌면 키가 달라져 기존 캐시가 자동 무효화됨"""
+    try:
+        return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+    except OSError:
+        return None
+
+
+_RESULT_CACHE_VERSION = _source_fingerprint()
+
+
+def _file_identity(file) -> Optional[str]:
+    """
+    파일 식별값: 경로는 (절대경로, mtime, 크기), 파일 객체는 내용의 blake2b 해시.
+    식별할 수 없으면 None (→ 캐시 사용 안 함).
+    """
+    try:
+        if isinstance(file, (str, os.PathLike)):
+            st = os.stat(file)
+            return f"path:{os.path.abspath(file)}:{st.st_mtime_ns}:{st.st_size}"
+        if hasattr(file, "getvalue"):  # BytesIO / Streamlit UploadedFile
+            data = file.getvalue()
+        elif hasattr(file, "read") and hasattr(file, "seek"):
+            start = file.tell()
+            data = file.read()
+            file.seek(start)
+        else:
+            return None
+    except (OSError, ValueError):
+        return None
+    # 확장자(CSV/Excel) 판별에 파일명이 쓰이므로 함께 키에 포함
+    name = getattr(file, "name", "")
+    return f"bytes:{name}:" + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _prune_result_cache() -> None:
+    """디스크 캐시 정리: 오래된 항목 삭제 후, 크기 상한을 넘으면 mtime(마지막 사용)이 오래된 순으로 삭제"""
+    try:
+        entries = []
+        for path in _RESULT_CACHE_DIR.iterdir():
+            st = path.stat()
+            entries.append((st.st_mtime, st.st_size, path))
+    except OSError:
+        return
+
+    cutoff = time.time() - _RESULT_CACHE_MAX_AGE
+    entries.sort(key=lambda e: e[0], reverse=True)  # 최근 사용 순
+    total = 0
+    for mtime, size, path in entries:
+        total += size
+        if mtime < cutoff or total > _RESULT_CACHE_MAX_BYTES:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _file_cached(func):
+    """file 인자 내용 + 나머지 인자가 같으면 이전 파싱 결과(복사본)를 반환하는 데코레이터"""
+    @wraps(func)
+    def wrapper(file, *args, **kwargs):
+        identity = _file_identity(file)
+        if identity is None or _RESULT_CACHE_VERSION is None:
+            return func(file, *args, **kwargs)
+
+        # 파서 소스 + 읽기 엔진/pandas 버전이 같을 때만 같은 결과로 취급
+        raw_key = repr((
+            _RESULT_CACHE_VERSION, _EXCEL_ENGINE, pd.__version__,
+            func.__name__, identity, args, sorted(kwargs.items()),
+        ))
+        key = hashlib.blake2b(raw_key.encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = _RESULT_CACHE_DIR / f"{key}.pickle"
+
+        # 1) 같은 프로세스 메모리 캐시 (Streamlit 세션 스레드 간 공유 → lock)
+        with _mem_cache_lock:
+            data = _mem_cache.get(key)
+            if data is not None:
+                _mem_cache.move_to_end(key)
+        if data is not None:
+            return pickle.loads(data)
+
+        # 2) 디스크 캐시 (적중 시 mtime 갱신 → 정리 시 최근 사용으로 취급)
+        try:
+            data = cache_path.read_bytes()
+            result = pickle.loads(data)
+            hit = True
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            hit = False
+
+        # 파싱은 except 블록 밖에서 실행 → 파싱 오류 traceback에 캐시 miss 예외가 엮이지 않음
+        if not hit:
+            result = func(file, *args, **kwargs)
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            try:
+                _RESULT_CACHE_DIR.mkdir(exist_ok=True)
+                tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass
+            _prune_result_cache()
+        else:
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+
+        with _mem_cache_lock:
+            _mem_cache[key] = data
+            _mem_cache.move_to_end(key)
+            while len(_mem_cache) > _MEM_CACHE_SIZE:
+                _mem_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+# 워크북은 excel_session 블록 안에서만 재사용하고 블록이 끝나면 닫는다
+# (스레드별 보관 → Streamlit 세션 간 공유 없음, 프로세스에 열린 파일 핸들이 남지 않음)
+_xl_session = threading.local()
+
+
+@contextmanager
+def excel_session():
+    """
+    블록 안의 get_excel_sheets / parse_* 호출이 같은 Excel 파일을 한 번만 열어 공유하도록 합니다.
+
+        with excel_session():
+            sheets = get_excel_sheets(f)
+            src = parse_table_file(f, "SRC", sheets[0])
+            tgt = parse_table_file(f, "TGT", sheets[1])
+    """
+    if getattr(_xl_session, "books", None) is not None:  # 중첩 시 바깥 블록이 관리
+        yield
+        return
+    _xl_session.books = {}
+    try:
+        yield
+    finally:
+        books, _xl_session.books = _xl_session.books, None
+        for xl in books.values():
+            xl.close()
+
+
+@contextmanager
+def _open_excel(file):
+    """
+    Excel 파일 열기 (python-calamine 설치 시 Rust 기반 calamine 엔진 사용).
+    excel_session 블록 안이면 열린 워크북을 공유하고, 아니면 사용 후 바로 닫습니다.
+    """
+    books = getattr(_xl_session, "books", None)
+    key = _file_identity(file) if books is not None else None
+    if key is not None:
+        xl = books.get(key)
+        if xl is None:
+            xl = books[key] = pd.ExcelFile(file, engine=_EXCEL_ENGINE)
+        yield xl
+        return
+
+    xl = pd.ExcelFile(file, engine=_EXCEL_ENGINE)
+    try:
+        yield xl
+    finally:
+        xl.close()
+
+
 # ─────────────────────────────────────────
 # Public API
 # ─────────────────────────────────────────
 
+@_file_cached
 def parse_table_file(
     file,
     table_name_hint: str = "UNKNOWN",
@@ -185,23 +431,13 @@ def parse_table_file(
         df = pd.read_csv(file, dtype=str)
         return _parse_dataframe(df, default_table_name=table_name_hint)
 
-    # Excel
-    xl = pd.ExcelFile(file)
-
-    if sheet_name:
-        df = xl.parse(sheet_name, dtype=str)
-        return _parse_dataframe(df, default_table_name=table_name_hint)
-
-    # 시트가 1개면 그냥 사용
-    if len(xl.sheet_names) == 1:
-        df = xl.parse(xl.sheet_names[0], dtype=str)
-        return _parse_dataframe(df, default_table_name=table_name_hint)
-
-    # 여러 시트인데 지정 없음 → 첫 번째 시트
-    df = xl.parse(xl.sheet_names[0], dtype=str)
+    # Excel: 시트 지정이 없으면 첫 번째 시트 (시트가 1개인 경우 포함)
+    with _open_excel(file) as xl:
+        df = xl.parse(sheet_name or xl.sheet_names[0], dtype=str)
     return _parse_dataframe(df, default_table_name=table_name_hint)
 
 
+@_file_cached
 def parse_source_target_file(file) -> tuple[Optional[dict], Optional[dict]]:
     """
     소스/타겟이 하나의 Excel 파일에 시트로 구분된 경우 파싱
@@ -209,21 +445,21 @@ def parse_source_target_file(file) -> tuple[Optional[dict], Optional[dict]]:
     Returns:
         (source_meta, target_meta) — 시트를 못 찾으면 None
     """
-    xl = pd.ExcelFile(file)
-
-    source_sheet = _find_sheet(xl, _SOURCE_SHEET_NAMES)
-    target_sheet = _find_sheet(xl, _TARGET_SHEET_NAMES)
-
     source_meta = None
     target_meta = None
 
-    if source_sheet:
-        df = xl.parse(source_sheet, dtype=str)
-        source_meta = _parse_dataframe(df, default_table_name="SOURCE_TABLE")
+    with _open_excel(file) as xl:
+        sheet_map = _sheet_map(xl)
+        source_sheet = _find_sheet(sheet_map, _SOURCE_SHEET_NAMES)
+        target_sheet = _find_sheet(sheet_map, _TARGET_SHEET_NAMES)
+
+        if source_sheet:
+            df = xl.parse(source_sheet, dtype=str)
+            source_meta = _parse_dataframe(df, default_table_name="SOURCE_TABLE")
 
-    if target_sheet:
-        df = xl.parse(target_sheet, dtype=str)
-        target_meta = _parse_dataframe(df, default_table_name="TARGET_TABLE")
+        if target_sheet:
+            df = xl.parse(target_sheet, dtype=str)
+            target_meta = _parse_dataframe(df, default_table_name="TARGET_TABLE")
 
     return source_meta, target_meta
 
@@ -243,14 +479,6 @@ def parse_mapping_file(file, sheet_name: Optional[str] = None) -> list[dict]:
           ...
         ]
     """
-    _MAPPING_ALIASES = {
-        "source_table":  ["source_table", "소스테이블", "src_table", "원천테이블", "source table"],
-        "source_col":    ["source_column", "source_col", "소스컬럼", "src_col", "원천컬럼", "source column"],
-        "target_table":  ["target_table", "타겟테이블", "tgt_table", "dest_table", "target table"],
-        "target_col":    ["target_column", "target_col", "타겟컬럼", "tgt_col", "target column"],
-        "transform":     ["transform", "변환규칙", "변환", "rule", "비고", "remarks"],
-    }
-
     if hasattr(file, "name"):
         filename = file.name
     else:
@@ -261,23 +489,19 @@ def parse_mapping_file(file, sheet_name: Optional[str] = None) -> list[dict]:
     if ext == "csv":
         df = pd.read_csv(file, dtype=str)
     else:
-        xl = pd.ExcelFile(file)
-        target = sheet_name
-        if not target:
-            target = _find_sheet(xl, _MAPPING_SHEET_NAMES)
-        if not target:
-            target = xl.sheet_names[0]
-        df = xl.parse(target, dtype=str)
+        with _open_excel(file) as xl:
+            target = sheet_name
+            if not target:
+                target = _find_sheet(_sheet_map(xl), _MAPPING_SHEET_NAMES)
+            if not target:
+                target = xl.sheet_names[0]
+            df = xl.parse(target, dtype=str)
 
     df = df.dropna(how="all").reset_index(drop=True)
     cols = list(df.columns)
 
     def detect(field):
-        aliases = [_normalize(a) for a in _MAPPING_ALIASES.get(field, [])]
-        for c in cols:
-            if _normalize(c) in aliases:
-                return c
-        return None
+        return _detect_column(cols, field, _MAPPING_ALIASES_NORM)
 
     src_tbl_col = detect("source_table")
     src_col_col = detect("source_col")
@@ -285,17 +509,26 @@ def parse_mapping_file(file, sheet_name: Optional[str] = None) -> list[dict]:
     tgt_col_col = detect("target_col")
     transform_col = detect("transform")
 
+    # dtype=str로 읽었으므로 값은 str 또는 NaN → 열 단위로 결측만 ""로 채움
+    def _values(col, upper=True) -> list[str]:
+        if not col:
+            return [""] * len(df)
+        s = df[col].fillna("").str.strip()
+        return (s.str.upper() if upper else s).tolist()
+
     rows = []
-    for _, row in df.iterrows():
-        entry = {
-            "source_table": str(row[src_tbl_col]).strip().upper() if src_tbl_col and not pd.isna(row.get(src_tbl_col)) else "",
-            "source_col":   str(row[src_col_col]).strip().upper()  if src_col_col and not pd.isna(row.get(src_col_col)) else "",
-            "target_table": str(row[tgt_tbl_col]).strip().upper()  if tgt_tbl_col and not pd.isna(row.get(tgt_tbl_col)) else "",
-            "target_col":   str(row[tgt_col_col]).strip().upper()  if tgt_col_col and not pd.isna(row.get(tgt_col_col)) else "",
-            "transform":    str(row[transform_col]).strip()         if transform_col and not pd.isna(row.get(transform_col)) else "",
-        }
-        if entry["source_col"] or entry["target_col"]:
-            rows.append(entry)
+    for src_tbl, src_col, tgt_tbl, tgt_col, transform in zip(
+        _values(src_tbl_col), _values(src_col_col), _values(tgt_tbl_col),
+        _values(tgt_col_col), _values(transform_col, upper=False),
+    ):
+        if src_col or tgt_col:
+            rows.append({
+                "source_table": src_tbl,
+                "source_col":   src_col,
+                "target_table": tgt_tbl,
+                "target_col":   tgt_col,
+                "transform":    transform,
+            })
 
     return rows
 
@@ -304,19 +537,23 @@ def parse_mapping_file(file, sheet_name: Optional[str] = None) -> list[dict]:
 # 매핑정의서 전용 파서 (DM/DW/ODS 표준 포맷)
 # ─────────────────────────────────────────
 
-def _val(row, idx) -> str:
-    """행에서 idx 위치 값을 안전하게 문자열로 반환"""
-    try:
-        v = row.iloc[idx]
-        return "" if pd.isna(v) else str(v).strip()
-    except (IndexError, KeyError):
-        return ""
+def _block_col(block, idx: int) -> list[str]:
+    """2차원 object 배열에서 idx 열을 문자열 리스트로 반환 (NaN/범위 밖 → "", 나머지는 str().strip())"""
+    if not 0 <= idx < block.shape[1]:
+        return [""] * len(block)
+    return [
+        v.strip() if type(v) is str else ("" if _is_na(v) else str(v).strip())
+        for v in block[:, idx]
+    ]
 
 
 def _is_number(v) -> bool:
     """No 컬럼 값이 숫자(행 번호)인지 확인"""
+    s = v.strip() if type(v) is str else str(v).strip()
+    if s.isdecimal():  # 가장 흔한 경우: 정수 행 번호 → 예외 처리 없이 판정
+        return True
     try:
-        float(str(v).strip())
+        float(s)
         return True
     except (ValueError, TypeError):
         return False
@@ -340,36 +577,35 @@ def _detect_col_positions(df: pd.DataFrame, subheader_idx: int) -> dict:
     sub-header 행과 그 위 행(그룹 헤더)을 스캔하여 각 필드의 컬럼 인덱스 반환.
     병합 셀로 인해 헤더 위치와 데이터 위치가 1칸 어긋나는 경우를 data_rows로 보정.
     """
-    sh = df.iloc[subheader_idx]
-    gh: pd.Series = df.iloc[subheader_idx - 1] if subheader_idx > 0 else pd.Series([], dtype=object)
-
-    col_name_idxs, pk_idxs, type_idxs, nn_idxs = [], [], [], []
-    table_idxs, system_idxs, transform_idxs = [], [], []
-
-    for i, v in enumerate(sh):
-        s = str(v).strip()
-        sl = s.lower()
-        if s in ("컬럼명", "Column Name", "COLUMN_NAME"):
-            col_name_idxs.append(i)
-        elif s == "PK":
-            pk_idxs.append(i)
-        elif "data type" in sl or s in ("데이터타입", "타입", "TYPE"):
-            type_idxs.append(i)
-        elif "n.n" in sl or s in ("N.N여부", "nullable", "null여부", "NN여부"):
-            nn_idxs.append(i)
-        elif "테이블명" in s or "table" in sl:
-            table_idxs.append(i)
-        elif "시스템명" in s or "system" in sl:
-            system_idxs.append(i)
-        elif "변환" in s or "transform" in sl or "rule" in sl:
-            transform_idxs.append(i)
-
-    # 그룹 헤더에서 변환규칙 위치 탐색
-    for i, v in enumerate(gh.values.tolist()):
-        s = str(v).strip()
-        if "변환" in s or "transform" in s.lower():
-            if i not in transform_idxs:
-                transform_idxs.append(i)
+    # 헤더 셀을 str().strip() 문자열 Series로 한 번에 변환 후 필드별 마스크로 분류
+    sh = df.iloc[subheader_idx].astype(str).str.strip().reset_index(drop=True)
+    sl = sh.str.lower()
+
+    def _has(series: pd.Series, keyword: str) -> pd.Series:
+        return series.str.contains(keyword, regex=False)
+
+    # if/elif 순서와 동일하게: 앞선 필드로 분류된 셀은 이후 필드 후보에서 제외
+    remaining = pd.Series(True, index=sh.index)
+
+    def _take(mask: pd.Series) -> list[int]:
+        nonlocal remaining
+        hit = mask & remaining
+        remaining &= ~hit
+        return sh.index[hit].tolist()
+
+    col_name_idxs  = _take(sh.isin(("컬럼명", "Column Name", "COLUMN_NAME")))
+    pk_idxs        = _take(sh == "PK")
+    type_idxs      = _take(_has(sl, "data type") | sh.isin(("데이터타입", "타입", "TYPE")))
+    nn_idxs        = _take(_has(sl, "n.n") | sh.isin(("N.N여부", "nullable", "null여부", "NN여부")))
+    table_idxs     = _take(_has(sh, "테이블명") | _has(sl, "table"))
+    system_idxs    = _take(_has(sh, "시스템명") | _has(sl, "system"))
+    transform_idxs = _take(_has(sh, "변환") | _has(sl, "transform") | _has(sl, "rule"))
+
+    # 그룹 헤더에서 변환규칙 위치 탐색 (sub-header에 없을 때만 사용됨)
+    if subheader_idx > 0:
+        gh = df.iloc[subheader_idx - 1].astype(str).str.strip().reset_index(drop=True)
+        gh_hit = _has(gh, "변환") | _has(gh.str.lower(), "transform")
+        transform_idxs += [i for i in gh.index[gh_hit].tolist() if i not in transform_idxs]
 
     pos = {
         "tgt_col":    col_name_idxs[0]   if len(col_name_idxs) > 0 else 1,
@@ -388,12 +624,16 @@ def _detect_col_positions(df: pd.DataFrame, subheader_idx: int) -> dict:
     # ── 병합 셀 오프셋 보정 ──
     # 헤더에서 탐지한 src_table 위치에 실제 데이터가 없고 +1 위치에 있으면 보정
     data_start = subheader_idx + 1
-    sample_vals = []
-    for ri in range(data_start, min(data_start + 5, len(df))):
-        row = df.iloc[ri]
-        if _is_number(_val(row, pos["tgt_col"] - 1 if pos["tgt_col"] > 0 else 0)) or \
-           _val(row, pos["tgt_col"]) != "":
-            sample_vals.append((_val(row, pos["src_table"]), _val(row, pos["src_table"] + 1)))
+    block = df.iloc[data_start:data_start + 5].to_numpy(dtype=object)
+    no_vals  = _block_col(block, pos["tgt_col"] - 1 if pos["tgt_col"] > 0 else 0)
+    tgt_vals = _block_col(block, pos["tgt_col"])
+    at_vals  = _block_col(block, pos["src_table"])
+    p1_vals  = _block_col(block, pos["src_table"] + 1)
+    sample_vals = [
+        (at_vals[i], p1_vals[i])
+        for i in range(len(block))
+        if _is_number(no_vals[i]) or tgt_vals[i] != ""
+    ]
 
     if sample_vals:
         at_pos     = sum(1 for v, _ in sample_vals if v and len(v) < 80)
@@ -456,28 +696,23 @@ def parse_mapping_definition_sheet(df: pd.DataFrame) -> dict:
     target_table = _extract_table_name_from_header(df)
 
     # 데이터 행 수집 (col 0 또는 tgt_col 위치에 값이 있는 행)
+    # 필요한 열만 object 배열에서 한 번에 문자열 리스트로 꺼낸 뒤 행 번호로 순회
     data_start = subheader_idx + 1
-    tgt_cols, src_cols, mapping_rows = [], [], []
-    src_table_candidates = {}
+    body = df.iloc[data_start:].to_numpy(dtype=object)
+    col = {field: _block_col(body, idx) for field, idx in pos.items() if field != "src_system"}
+    tgt_names = [v.upper() for v in col["tgt_col"]]
 
-    for ri in range(data_start, len(df)):
-        row = df.iloc[ri]
-
-        no_val   = _val(row, 0)
-        tgt_name = _val(row, pos["tgt_col"]).upper()
-
-        # 데이터 행 판단: No 컬럼이 숫자이거나 타겟 컬럼명이 있으면
-        if not tgt_name and not _is_number(no_val):
-            continue
+    tgt_cols, src_cols, mapping_rows = [], [], []
+    src_table_candidates = Counter()
 
-        if not tgt_name:
-            continue
+    # 데이터 행 판단: 타겟 컬럼명이 있어야 함 (No 컬럼만 숫자이고 컬럼명이 없으면 건너뜀)
+    for ri in (i for i, name in enumerate(tgt_names) if name):
+        tgt_name = tgt_names[ri]
 
         # 타겟 컬럼 정보
-        tgt_pk   = _is_yes(_val(row, pos["tgt_pk"]))
-        tgt_type = _val(row, pos["tgt_type"])
-        tgt_nn   = _val(row, pos["tgt_nn"]).upper()
-        tgt_nullable = tgt_nn not in ("NN", "N", "NOT NULL", "Y")  # NN = NOT NULL → nullable=False
+        tgt_pk   = _is_yes(col["tgt_pk"][ri])
+        tgt_type = col["tgt_type"][ri]
+        tgt_nullable = col["tgt_nn"][ri].upper() not in _MAPPING_NN_VALUES  # NN = NOT NULL → nullable=False
 
         tgt_cols.append({
             "name":        tgt_name,
@@ -488,17 +723,16 @@ def parse_mapping_definition_sheet(df: pd.DataFrame) -> dict:
         })
 
         # 소스 정보
-        src_tbl_val  = _val(row, pos["src_table"]).upper()
-        src_col_val  = _val(row, pos["src_col"]).upper()
-        src_pk       = _is_yes(_val(row, pos["src_pk"]))
-        src_type     = _val(row, pos["src_type"])
-        src_nn       = _val(row, pos["src_nn"]).upper()
-        src_nullable = src_nn not in ("NN", "N", "NOT NULL", "Y")
-        transform    = _val(row, pos["transform"])
+        src_tbl_val  = col["src_table"][ri].upper()
+        src_col_val  = col["src_col"][ri].upper()
+        src_pk       = _is_yes(col["src_pk"][ri])
+        src_type     = col["src_type"][ri]
+        src_nullable = col["src_nn"][ri].upper() not in _MAPPING_NN_VALUES
+        transform    = col["transform"][ri]
 
         # SQL이 아닌 실제 테이블명 수집 (80자 이하 = 테이블명, 이상 = SQL)
         if src_tbl_val and len(src_tbl_val) < 80:
-            src_table_candidates[src_tbl_val] = src_table_candidates.get(src_tbl_val, 0) + 1
+            src_table_candidates[src_tbl_val] += 1
 
         if src_col_val:
             src_cols.append({
@@ -518,9 +752,8 @@ def parse_mapping_definition_sheet(df: pd.DataFrame) -> dict:
                 "transform":    transform,
             })
 
-    # 소스 테이블명: 가장 많이 등장한 값
-    src_table = max(src_table_candidates, key=lambda k: src_table_candidates[k]) \
-        if src_table_candidates else "SOURCE_TABLE"
+    # 소스 테이블명: 가장 많이 등장한 값 (동률이면 먼저 나온 값)
+    src_table = src_table_candidates.most_common(1)[0][0] if src_table_candidates else "SOURCE_TABLE"
 
     # 소스 컬럼에서 _src_table 키 제거
     for c in src_cols:
@@ -544,6 +777,7 @@ def parse_mapping_definition_sheet(df: pd.DataFrame) -> dict:
     }
 
 
+@_file_cached
 def parse_mapping_definition_excel(file, sheet_name: Optional[str] = None) -> dict:
     """
     DM/DW/ODS 매핑정의서 Excel 파일 파싱 (단일 파일에 소스+타겟 포함).
@@ -559,10 +793,10 @@ def parse_mapping_definition_excel(file, sheet_name: Optional[str] = None) -> di
           "mapping":     [...],
         }
     """
-    xl = pd.ExcelFile(file)
-    sheet = sheet_name or xl.sheet_names[0]
-    # 병합 셀을 그대로 읽기 위해 header=None
-    df = xl.parse(sheet, header=None, dtype=str)
+    with _open_excel(file) as xl:
+        sheet = sheet_name or xl.sheet_names[0]
+        # 병합 셀을 그대로 읽기 위해 header=None
+        df = xl.parse(sheet, header=None, dtype=str)
     return parse_mapping_definition_sheet(df)
 
 
@@ -612,21 +846,19 @@ def schema_to_metadata(schema_dict: dict, table_name: str) -> dict:
 def get_excel_sheets(file) -> list[str]:
     """Excel 파일의 시트 목록 반환"""
     try:
-        xl = pd.ExcelFile(file)
-        return xl.sheet_names
+        with _open_excel(file) as xl:
+            return xl.sheet_names
     except Exception:
         return []
 
 
 def metadata_to_display(meta: dict) -> pd.DataFrame:
     """메타데이터를 Streamlit 표시용 DataFrame으로 변환"""
-    rows = []
-    for col in meta.get("columns", []):
-        rows.append({
-            "컬럼명":     col["name"],
-            "데이터타입": col["type"],
-            "PK":        "✓" if col["pk"] else "",
-            "NULL허용":  "Y" if col["nullable"] else "N",
-            "설명":      col["description"],
-        })
-    return pd.DataFrame(rows)
+    cols = meta.get("columns", [])
+    return pd.DataFrame({
+        "컬럼명":     [c["name"] for c in cols],
+        "데이터타입": [c["type"] for c in cols],
+        "PK":        ["✓" if c["pk"] else "" for c in cols],
+        "NULL허용":  ["Y" if c["nullable"] else "N" for c in cols],
+        "설명":      [c["description"] for c in cols],
+    })
@@ -227,6 +227,42 @@ def generate_validation_queries(
     return _parse_llm_response(raw, source_meta, target_meta, db_type, column_mapping)
 
 
+# LLM 응답의 ```json ... ``` 코드 펜스
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.IGNORECASE | re.DOTALL)
+
+
+def _extract_json_object(text: str) -> str:
+    """
+    첫 '{'부터 괄호 깊이가 0으로 돌아오는 '}'까지 한 번에 스캔해 잘라냅니다.
+    JSON 문자열 내부의 괄호는 무시하며, 뒤따르는 설명문에 '}'가 있어도 영향받지 않습니다.
+    """
+    start = text.find("{")
+    if start == -1:
+        return text
+    depth = 0
+    in_str = escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    # 닫히지 않은 경우 기존 동작과 같이 마지막 '}'까지
+    end = text.rfind("}")
+    return text[start:end + 1] if end > start else text[start:]
+
+
 def _parse_llm_response(
     raw: str,
     source_meta: dict,
@@ -236,16 +272,11 @@ def _parse_llm_response(
 ) -> dict:
     """LLM 응답에서 JSON 파싱, 실패 시 rule-based 폴백"""
     # JSON 블록 추출
-    text = raw.strip()
-    json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", text)
-    if json_match:
-        text = json_match.group(1).strip()
+    json_match = _JSON_FENCE_RE.search(raw)
+    text = (json_match.group(1) if json_match else raw).strip()
 
-    # 순수 JSON 시작점 찾기
-    brace_start = text.find("{")
-    brace_end = text.rfind("}")
-    if brace_start != -1 and brace_end != -1:
-        text = text[brace_start:brace_end + 1]
+    # 순수 JSON 객체 구간 찾기
+    text = _extract_json_object(text)
 
     try:
         result = json.loads(text)
@@ -267,6 +298,12 @@ def _parse_llm_response(
 # AI 생성 SQL 후처리 검증
 # ─────────────────────────────────────────
 
+# 방언 치환 패턴 (호출마다 re 내부 캐시를 조회하지 않도록 모듈 로드 시 컴파일)
+_MINUS_RE   = re.compile(r'\bMINUS\b', re.IGNORECASE)
+_EXCEPT_RE  = re.compile(r'\bEXCEPT\b', re.IGNORECASE)
+_LIMIT_N_RE = re.compile(r'\bLIMIT\s+(\d+)\b', re.IGNORECASE)
+
+
 def _post_validate_sql(queries: dict, db_type: str) -> dict:
     """AI가 생성한 SQL에 대한 후처리 검증 및 자동 치환"""
     is_oracle = db_type.lower() == "oracle"
@@ -277,26 +314,35 @@ def _post_validate_sql(queries: dict, db_type: str) -> dict:
         if not sql:
             continue
 
+        # 키워드가 아예 없으면 정규식 스캔 생략 (부분 문자열 검사가 훨씬 저렴)
+        upper = sql.upper()
+
         if is_postgres:
             # MINUS → EXCEPT 치환
-            sql = re.sub(r'\bMINUS\b', 'EXCEPT', sql, flags=re.IGNORECASE)
+            if "MINUS" in upper:
+                sql = _MINUS_RE.sub('EXCEPT', sql)
             # UNION ALL 중간의 bare LIMIT → 서브쿼리로 래핑
-            sql = _wrap_limit_in_union(sql)
+            if "UNION" in upper and "LIMIT" in upper:
+                sql = _wrap_limit_in_union(sql)
         elif is_oracle:
             # LIMIT N → FETCH FIRST N ROWS ONLY 치환
-            sql = re.sub(
-                r'\bLIMIT\s+(\d+)\b',
-                r'FETCH FIRST \1 ROWS ONLY',
-                sql, flags=re.IGNORECASE
-            )
+            if "LIMIT" in upper:
+                sql = _LIMIT_N_RE.sub(r'FETCH FIRST \1 ROWS ONLY', sql)
             # EXCEPT → MINUS 치환
-            sql = re.sub(r'\bEXCEPT\b', 'MINUS', sql, flags=re.IGNORECASE)
+            if "EXCEPT" in upper:
+                sql = _EXCEPT_RE.sub('MINUS', sql)
 
         item["sql"] = sql
 
     return queries
 
 
+# UNION 키워드 / LIMIT N 을 한 패턴으로 — _wrap_limit_in_union의 단일 스캔용.
+# 대문자로 변환한 본문에 대소문자 구분 매칭 (IGNORECASE의 문자별 case-folding 생략)
+_UNION_LIMIT_RE = re.compile(r'\b(?:UNION\b|LIMIT\s+(?P<limit>\d+))')
+_LIMIT_STRIP_RE = re.compile(r'\s*\bLIMIT\s+\d+\b', re.IGNORECASE)
+
+
 def _wrap_limit_in_union(sql: str) -> str:
     """
     PostgreSQL: UNION/UNION ALL 분기 내부에 LIMIT가 있으면
@@ -314,28 +360,32 @@ def _wrap_limit_in_union(sql: str) -> str:
         )
         SELECT * FROM _cte LIMIT 10;
     """
-    if not re.search(r'\bUNION\b', sql, re.IGNORECASE):
-        return sql
-
+    # UNION 위치와 LIMIT N(위치·값)을 한 번의 스캔으로 수집
     sql_body = sql.rstrip(';').strip()
-    had_semi = sql.rstrip().endswith(';')
-
-    # 마지막 UNION 키워드 위치를 찾아, 그 앞에 LIMIT가 있으면 분기 내 LIMIT 존재
-    union_positions = [m.start() for m in re.finditer(r'\bUNION\b', sql_body, re.IGNORECASE)]
-    if not union_positions:
+    last_union = -1
+    first_limit = None
+    # 위치는 UNION/LIMIT 간 선후 비교에만 쓰이므로 대문자 본문 기준이어도 무방
+    for m in _UNION_LIMIT_RE.finditer(sql_body.upper()):
+        if m.group("limit") is None:
+            last_union = m.start()
+        elif first_limit is None:
+            first_limit = m
+
+    if last_union == -1:
         return sql
 
-    before_last_union = sql_body[:union_positions[-1]]
-    if not re.search(r'\bLIMIT\s+\d+', before_last_union, re.IGNORECASE):
+    # 첫 LIMIT가 마지막 UNION 앞에 있어야 분기 내 LIMIT 존재
+    if first_limit is None or first_limit.start() >= last_union:
         # 분기 내 LIMIT 없음 — 이미 올바른 형태
         return sql
 
+    had_semi = sql.rstrip().endswith(';')
+
     # 대표 LIMIT 값 추출 (첫 번째 LIMIT 기준)
-    limit_match = re.search(r'\bLIMIT\s+(\d+)', sql_body, re.IGNORECASE)
-    limit_val = limit_match.group(1) if limit_match else "100"
+    limit_val = first_limit.group("limit")
 
     # 모든 LIMIT N 제거 후 CTE로 래핑
-    cleaned = re.sub(r'\s*\bLIMIT\s+\d+\b', '', sql_body, flags=re.IGNORECASE).strip()
+    cleaned = _LIMIT_STRIP_RE.sub('', sql_body).strip()
     result = f"WITH _cte AS (\n{cleaned}\n)\nSELECT * FROM _cte\nLIMIT {limit_val}"
     if had_semi:
         result += ';'
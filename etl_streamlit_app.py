@@ -1476,9 +1476,11 @@ if page == "데이터 프로파일":
 
         # Top Values expander (컬럼별)
         with st.expander("컬럼별 상위 빈도 값 상세"):
+            from aetl_profiler import top_values_records
             for c in profile["columns"]:
-                if c.get("top_values"):
-                    tv_df = pd.DataFrame(c["top_values"])
+                tv_records = top_values_records(c.get("top_values"))
+                if tv_records:
+                    tv_df = pd.DataFrame(tv_records)
                     tv_df.columns = ["값", "건수"]
                     st.caption(f"**{c['name']}** ({c['type']})")
                     st.dataframe(tv_df, width='stretch', hide_index=True, height=180)
@@ -2618,11 +2620,13 @@ if mode == "파일 업로드":
                 tgt_hint_combo  = st.text_input("타겟 테이블명", value="TARGET_TABLE", key="combo_tgt_hint")
 
             if st.button("파싱 실행", key="parse_combo", type="primary"):
-                from etl_metadata_parser import parse_table_file
+                from etl_metadata_parser import excel_session, parse_table_file
                 try:
-                    st.session_state.source_meta = parse_table_file(combo_file, src_hint_combo, src_sheet_combo)
-                    combo_file.seek(0)
-                    st.session_state.target_meta = parse_table_file(combo_file, tgt_hint_combo, tgt_sheet_combo)
+                    # 같은 통합 파일의 두 시트 → 워크북을 한 번만 열어 공유
+                    with excel_session():
+                        st.session_state.source_meta = parse_table_file(combo_file, src_hint_combo, src_sheet_combo)
+                        combo_file.seek(0)
+                        st.session_state.target_meta = parse_table_file(combo_file, tgt_hint_combo, tgt_sheet_combo)
                     st.session_state.queries = None
                     st.success("파싱 완료")
                 except Exception as e:
@@ -19,6 +19,27 @@ from app import run, TokenLimitError
 # =============================================================================
 # SQL 포맷팅 함수
 # =============================================================================
+_WS_RE = re.compile(r'\s+')
+_SELECT_HEAD_RE = re.compile(r'^SELECT\s+', re.IGNORECASE)
+
+# 줄바꿈을 넣을 주요 키워드 (여러 단어 키워드를 먼저 두어 우선 매칭)
+_BREAK_KEYWORDS = [
+    'LEFT JOIN', 'RIGHT JOIN', 'INNER JOIN', 'GROUP BY', 'ORDER BY', 'FETCH FIRST',
+    'SELECT', 'FROM', 'JOIN', 'WHERE', 'AND', 'OR', 'HAVING', 'LIMIT', 'OFFSET',
+]
+_KEYWORD_BREAK_RE = re.compile(
+    r'\s+(' + '|'.join(_BREAK_KEYWORDS) + r')\b', re.IGNORECASE
+)
+
+
+def _break_before_keyword(m: re.Match) -> str:
+    kw = m.group(1)
+    # 'LEFT JOIN' 등은 JOIN 앞에서도 줄을 나눔 (LEFT\nJOIN)
+    if kw[-4:].upper() == 'JOIN' and ' ' in kw:
+        kw = kw.replace(' ', '\n')
+    return '\n' + kw
+
+
 def format_sql(sql: str) -> str:
     """
     Args:
@@ -30,22 +51,13 @@ def format_sql(sql: str) -> str:
         return sql
 
     # 먼저 기존 줄바꿈 정리 (여러 줄바꿈을 하나로)
-    sql = re.sub(r'\s+', ' ', sql).strip()
-
-    # 주요 키워드 앞에 줄바꿈 추가
-    keywords = [
-        'SELECT', 'FROM', 'LEFT JOIN', 'RIGHT JOIN', 'INNER JOIN', 'JOIN',
-        'WHERE', 'AND', 'OR', 'GROUP BY', 'HAVING', 'ORDER BY',
-        'FETCH FIRST', 'LIMIT', 'OFFSET'
-    ]
+    sql = _WS_RE.sub(' ', sql).strip()
 
-    for kw in keywords:
-        # 키워드 앞에 줄바꿈 추가 (대소문자 무관)
-        pattern = rf'(?i)\s+({kw})\b'
-        sql = re.sub(pattern, rf'\n\1', sql)
+    # 주요 키워드 앞에 줄바꿈 추가 (한 번의 치환으로 처리)
+    sql = _KEYWORD_BREAK_RE.sub(_break_before_keyword, sql)
 
     # SELECT 다음 컬럼들 들여쓰기
-    sql = re.sub(r'(?i)^SELECT\s+', 'SELECT\n    ', sql)
+    sql = _SELECT_HEAD_RE.sub('SELECT\n    ', sql)
 
     # 콤마 후 줄바꿈 (SELECT 절의 컬럼 구분)
     # SELECT와 FROM 사이의 콤마만 처리